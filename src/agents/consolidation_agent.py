@@ -246,17 +246,31 @@ Return ONLY valid JSON, no other text."""
             requirements.get('business_rules', [])
         )
         
+        # Index question IDs by policy reference once, rather than rescanning
+        # every question's reference for each requirement
+        question_ids_by_ref = {}
+        # LLM output may carry lists or dicts as references; those are matched by scanning
+        unindexed_questions = []
+        for q in questions:
+            ref = q.get('policy_reference')
+            if isinstance(ref, str):
+                question_ids_by_ref.setdefault(ref, []).append(q.get('question_id', ''))
+            else:
+                unindexed_questions.append(q)
+        
         # Create mapping
         for req in all_requirements:
             req_id = req.get('requirement_id', '')
             policy_ref = req.get('policy_reference', '')
             
             # Find related questions
-            related_questions = [
-                q.get('question_id', '')
-                for q in questions
-                if q.get('policy_reference') == policy_ref
-            ]
+            if isinstance(policy_ref, str):
+                related_questions = list(question_ids_by_ref.get(policy_ref, ()))
+            else:
+                related_questions = [
+                    q.get('question_id', '') for q in unindexed_questions
+                    if q.get('policy_reference') == policy_ref
+                ]
             
             matrix.append({
                 'policy_reference': policy_ref,
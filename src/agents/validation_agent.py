@@ -5,7 +5,12 @@ import json
 import os
 from openai import OpenAI
 from .base_agent import BaseAgent
-from ..utils.validator import Validator
+from ..utils.validator import (
+    validate_requirement,
+    validate_question,
+    check_requirement_coverage,
+    check_question_requirement_mapping
+)
 
 logger = logging.getLogger(__name__)
 
@@ -141,7 +146,7 @@ class ValidationAgent(BaseAgent):
         errors = []
         
         for req in requirements:
-            is_valid, req_errors = Validator.validate_requirement(req)
+            is_valid, req_errors = validate_requirement(req)
             if is_valid:
                 valid_count += 1
             else:
@@ -170,7 +175,7 @@ class ValidationAgent(BaseAgent):
         errors = []
         
         for q in questions:
-            is_valid, q_errors = Validator.validate_question(q)
+            is_valid, q_errors = validate_question(q)
             if is_valid:
                 valid_count += 1
             else:
@@ -217,10 +222,10 @@ class ValidationAgent(BaseAgent):
             policy_sections = ['V1.1', 'V2.1', 'V3.1', 'V4.1', 'V5.1']
         
         # Check requirement coverage
-        requirement_coverage = Validator.check_requirement_coverage(requirements, policy_sections)
+        requirement_coverage = check_requirement_coverage(requirements, policy_sections)
         
         # Check question-requirement mapping
-        question_mapping = Validator.check_question_requirement_mapping(questions, requirements)
+        question_mapping = check_question_requirement_mapping(questions, requirements)
         
         return {
             'requirement_coverage': requirement_coverage,
@@ -69,6 +69,36 @@ def show_performance_overview(stages: List[Dict], outputs: Dict[str, Any]) -> No
     
     st.subheader("🎯 Agent Performance Overview")
     
+    metrics = _aggregate_agent_metrics(stages)
+    total_processing_time = metrics['total_processing_time']
+    total_outputs = metrics['total_outputs']
+    successful_agents = metrics['successful_agents']
+    avg_quality = metrics['avg_quality']
+    
+    # Display metrics
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("Total Processing Time", f"{total_processing_time:.1f}s")
+    
+    with col2:
+        st.metric("Average Quality Score", f"{avg_quality:.1f}%")
+    
+    with col3:
+        st.metric("Successful Agents", f"{successful_agents}/{len(stages)}")
+    
+    with col4:
+        st.metric("Total Outputs Generated", str(total_outputs))
+    
+    # Create detailed agent table
+    st.subheader("📊 Detailed Agent Metrics")
+    st.dataframe(metrics['agent_table'], use_container_width=True)
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _aggregate_agent_metrics(stages: List[Dict]) -> Dict[str, Any]:
+    """Aggregate overview totals and the per-agent metrics table for a list of stages."""
+    
     # Calculate actual metrics from the workflow data
     total_processing_time = 0
     total_outputs = 0
@@ -95,26 +125,6 @@ def show_performance_overview(stages: List[Dict], outputs: Dict[str, Any]) -> No
                 validation_score = validation_report.get('overall_score', 75.0)
                 break
     
-    avg_quality = validation_score
-    
-    # Display metrics
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.metric("Total Processing Time", f"{total_processing_time:.1f}s")
-    
-    with col2:
-        st.metric("Average Quality Score", f"{avg_quality:.1f}%")
-    
-    with col3:
-        st.metric("Successful Agents", f"{successful_agents}/{len(stages)}")
-    
-    with col4:
-        st.metric("Total Outputs Generated", str(total_outputs))
-    
-    # Create detailed agent table
-    st.subheader("📊 Detailed Agent Metrics")
-    
     agent_data = []
     for i, stage in enumerate(stages):
         agent_name = stage.get('name', f'Agent_{i}').replace('_', ' ').title()
@@ -137,10 +147,13 @@ def show_performance_overview(stages: List[Dict], outputs: Dict[str, Any]) -> No
             'Details': f"{output_count} outputs in {duration:.1f}s"
         })
     
-    # Display as DataFrame
-    import pandas as pd
-    df = pd.DataFrame(agent_data)
-    st.dataframe(df, use_container_width=True)
+    return {
+        'total_processing_time': total_processing_time,
+        'total_outputs': total_outputs,
+        'successful_agents': successful_agents,
+        'avg_quality': validation_score,
+        'agent_table': pd.DataFrame(agent_data)
+    }
 
 
 def show_timing_analysis(stages: List[Dict]) -> None:
@@ -1,7 +1,8 @@
 import streamlit as st
+import hashlib
 import tempfile
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 import sys
 
 # Add project root to path
@@ -118,15 +119,14 @@ def _show_live_mode_upload() -> Optional[Dict[str, Any]]:
         )
         
         if uploaded_file is not None:
-            # Save uploaded file temporarily
-            with tempfile.NamedTemporaryFile(delete=False, suffix=f".{uploaded_file.name.split('.')[-1]}") as tmp_file:
-                tmp_file.write(uploaded_file.getvalue())
-                tmp_file_path = tmp_file.name
+            file_bytes = uploaded_file.getvalue()
+            file_sha1 = hashlib.sha1(file_bytes).hexdigest()
             
             try:
-                # Parse the document
-                parser = EnhancedDocumentParser()
-                document_data = parser.load_document(tmp_file_path)
+                # Parse the document (cached per file content across reruns)
+                document_data, tmp_file_path = _parse_uploaded_document(
+                    file_sha1, uploaded_file.name.split('.')[-1], file_bytes
+                )
                 
                 # Show success message
                 st.success(f"✅ Successfully loaded: {uploaded_file.name}")
@@ -154,16 +154,39 @@ def _show_live_mode_upload() -> Optional[Dict[str, Any]]:
             except Exception as e:
                 st.error(f"Error processing document: {str(e)}")
                 return None
-            finally:
-                # Clean up temporary file
-                try:
-                    Path(tmp_file_path).unlink()
-                except:
-                    pass
     
     return None
 
 
+@st.cache_data(max_entries=16, ttl=3600, show_spinner=False)
+def _parse_uploaded_document(file_sha1: str, extension: str, _file_bytes: bytes) -> Tuple[Dict[str, Any], str]:
+    """
+    Parse uploaded file bytes once per distinct file.
+    
+    The cache is keyed on the SHA-1 of the content (and the extension); the
+    raw bytes are excluded from hashing via the leading underscore. Parsed
+    documents are kept for at most 16 recent uploads, for up to an hour.
+    
+    Returns:
+        Tuple of (parsed document data, path of the temporary file that was
+        parsed; the file is deleted before returning, so the path is stale)
+    """
+    # Save uploaded file temporarily
+    with tempfile.NamedTemporaryFile(delete=False, suffix=f".{extension}") as tmp_file:
+        tmp_file.write(_file_bytes)
+        tmp_file_path = tmp_file.name
+    
+    try:
+        parser = EnhancedDocumentParser()
+        return parser.load_document(tmp_file_path), tmp_file_path
+    finally:
+        # Clean up temporary file
+        try:
+            Path(tmp_file_path).unlink()
+        except:
+            pass
+
+
 def show_document_preview(document_info: Dict[str, Any]):
     """Show document preview and metadata."""
     if not document_info:
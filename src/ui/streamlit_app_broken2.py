@@ -3,11 +3,16 @@ import json
 import os
 from pathlib import Path
 import sys
+from collections import defaultdict
 from datetime import datetime
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-import random
+import zlib
+
+# Fast JSON serialization for downloads
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
@@ -20,6 +25,485 @@ from src.generators.policy_generator import PolicyGenerator
 from src.ui.enhanced_file_upload import show_enhanced_file_upload, get_document_content, get_document_path
 from src.ui.agent_dashboard import show_agent_performance_dashboard
 
+# Stage statuses that count as finished
+_DONE_STATUSES = frozenset({'completed', 'success'})
+
+# Display icons for recommendation priorities and stage statuses
+_PRIORITY_ICONS = {"high": "🔴", "medium": "🟡", "low": "🟢"}
+_STATUS_ICONS = {"completed": "✅", "success": "✅", "failed": "❌"}
+
+# Markdown hard line break, used to emit several lines with one st.markdown call
+_MD_LINE_BREAK = "  \n"
+
+# Output keys holding requirement lists
+_REQUIREMENT_KEYS = ('functional_requirements', 'data_requirements', 'business_rules', 'validation_rules')
+
+
+def _stage_items(stages):
+    """Yield (name, info) pairs for stages stored either as a dict or as a list of stage dicts."""
+    if isinstance(stages, dict):
+        return stages.items()
+    return ((stage.get('name', f'Stage {i}'), stage) for i, stage in enumerate(stages, 1))
+
+
+@st.cache_data(show_spinner=False)
+def _mock_results() -> dict:
+    """Generate mock workflow results once and reuse them across reruns."""
+    return MockResultsGenerator().generate_complete_workflow_results()
+
+
+def _save_results(results: dict) -> None:
+    """Keep results in this session's state along with a timestamp for download names."""
+    st.session_state.results = results
+    st.session_state.results_ts = datetime.now().strftime('%Y%m%d_%H%M%S')
+
+
+def _load_results():
+    """Return the results for this session, or None if there are none."""
+    return st.session_state.get('results')
+
+
+def _answer_column(input_type: str):
+    """Map a question input type to a data_editor column for its answers."""
+    if input_type == 'number':
+        return st.column_config.NumberColumn("Answer")
+    if input_type == 'date':
+        return st.column_config.DateColumn("Answer")
+    if input_type == 'boolean':
+        return st.column_config.CheckboxColumn("Answer")
+    return st.column_config.TextColumn("Answer")
+
+
+def _results_json(results: dict) -> bytes:
+    """Serialize workflow results for download."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            results,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+            default=str
+        )
+    return json.dumps(results, indent=2, default=str).encode('utf-8')
+
+
+@st.cache_data(show_spinner=False)
+def _stage_bar(items: tuple):
+    """Build the processing-time bar chart from (stage, duration) pairs."""
+    import plotly.graph_objects as go
+    
+    names = [stage for stage, _ in items]
+    durations = [duration for _, duration in items]
+    fig = go.Figure(go.Bar(x=names, y=durations))
+    fig.update_layout(title="Processing Time by Stage", xaxis_title="Stage", yaxis_title="Duration")
+    return fig
+
+
+@st.cache_data(show_spinner=False)
+def _comparison_bar(items: tuple):
+    """Build the requirements comparison bar chart from (policy, requirements) pairs."""
+    import pandas as pd
+    import plotly.express as px
+    
+    df = pd.DataFrame([{'Policy': policy, 'Requirements': count} for policy, count in items])
+    return px.bar(df, x='Policy', y='Requirements', title="Requirements Comparison")
+
+
+def _generate_policy_markdown(visa_name: str, visa_category: str, generated_at: str) -> str:
+    """Build the synthetic policy document for the given inputs."""
+    return f"""# {visa_name}
+Category: {visa_category.title()}
+Generated: {generated_at}
+
+## Eligibility Criteria
+- Valid passport required
+- Proof of financial support
+- Clean criminal record
+
+## Application Process
+1. Complete online form
+2. Submit documents
+3. Pay fees
+4. Attend interview"""
+
+
+def _generate_mock_summary(policy_name: str, num_requirements: int, validation_score: int, generated_at: str) -> dict:
+    """Build the synthetic results summary for the given inputs."""
+    return {
+        'policy_name': policy_name,
+        'total_requirements': num_requirements,
+        'validation_score': validation_score,
+        'status': 'completed',
+        'generated_at': generated_at
+    }
+
+
+@st.fragment
+def _tab_policy_analysis(outputs):
+    """Render the policy structure analysis tab."""
+    if not outputs:
+        st.info("No policy analysis data available")
+        return
+    
+    st.header("📄 Policy Structure Analysis")
+    
+    # Policy structure
+    if 'policy_structure' in outputs:
+        policy_structure = outputs['policy_structure']
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            st.subheader("📋 Basic Information")
+            visa_type = policy_structure.get('visa_type', 'Unknown')
+            visa_code = policy_structure.get('visa_code', 'Unknown')
+            st.write(f"**Visa Type:** {visa_type}")
+            st.write(f"**Visa Code:** {visa_code}")
+        
+        with col2:
+            st.subheader("🎯 Objectives")
+            objectives = policy_structure.get('objectives', [])
+            if objectives:
+                st.markdown(_MD_LINE_BREAK.join(f"• {obj}" for obj in objectives[:3]))
+    
+    # Eligibility rules
+    if 'eligibility_rules' in outputs:
+        st.subheader("📜 Eligibility Rules")
+        eligibility_rules = outputs['eligibility_rules']
+        
+        if isinstance(eligibility_rules, list):
+            rule_lines = []
+            for rule in eligibility_rules[:5]:
+                if isinstance(rule, dict):
+                    description = rule.get('description', rule.get('requirement', str(rule)))
+                    mandatory = rule.get('mandatory', True)
+                    status_icon = "🔴" if mandatory else "🟡"
+                    rule_lines.append(f"{status_icon} {description}")
+                else:
+                    rule_lines.append(f"• {str(rule)}")
+            if rule_lines:
+                st.markdown(_MD_LINE_BREAK.join(rule_lines))
+
+
+@st.fragment
+def _tab_requirements(outputs):
+    """Render the requirements analysis tab."""
+    if not outputs:
+        st.info("No requirements data available")
+        return
+    
+    st.header("📋 Requirements Analysis")
+    
+    # Create requirement sections
+    requirement_types = [
+        ('functional_requirements', 'Functional Requirements', '⚙️'),
+        ('data_requirements', 'Data Requirements', '📊'),
+        ('business_rules', 'Business Rules', '💼'),
+        ('validation_rules', 'Validation Rules', '✅')
+    ]
+    
+    import pandas as pd
+    
+    # One virtualized table per category instead of an expander per requirement
+    for req_type, title, icon in requirement_types:
+        requirements = outputs.get(req_type)
+        if requirements:
+            st.subheader(f"{icon} {title}")
+            
+            rows = []
+            for req in requirements[:50]:
+                if isinstance(req, dict):
+                    rows.append({
+                        'ID': req.get('requirement_id', 'N/A'),
+                        'Description': req.get('description', str(req)),
+                        'Priority': req.get('priority', 'Unknown'),
+                        'Reference': req.get('policy_reference', '')
+                    })
+                else:
+                    rows.append({'ID': 'N/A', 'Description': str(req), 'Priority': '', 'Reference': ''})
+            
+            st.dataframe(pd.DataFrame(rows), use_container_width=True, hide_index=True)
+
+
+@st.fragment
+def _tab_questions(outputs):
+    """Render the application questions tab."""
+    if 'application_questions' not in outputs:
+        st.info("No questions data available")
+        return
+    
+    questions = outputs['application_questions']
+    if not questions:
+        st.info("No questions generated")
+        return
+    
+    st.header("❓ Application Questions")
+    
+    # Group questions by section, normalizing plain strings into question dicts
+    sections = defaultdict(list)
+    for q in questions:
+        if isinstance(q, dict):
+            sections[q.get('section', 'General')].append(q)
+        else:
+            sections['General'].append({'question': str(q), 'input_type': 'text'})
+    
+    import pandas as pd
+    
+    # Display questions by section - one data_editor per section instead of a widget per question
+    for section, section_questions in sections.items():
+        st.subheader(f"📝 {section}")
+        
+        rows = []
+        input_types = set()
+        for q in section_questions:
+            input_types.add(q.get('input_type', 'text'))
+            rows.append({
+                'Question': q.get('question', q.get('description', str(q))),
+                'Required': bool(q.get('required', False)),
+                'Answer': None
+            })
+        
+        # Sections with a single input type get a matching answer column
+        answer_column = st.column_config.TextColumn("Answer")
+        if len(input_types) == 1:
+            answer_column = _answer_column(input_types.pop())
+        
+        st.data_editor(
+            pd.DataFrame(rows),
+            column_config={'Answer': answer_column},
+            disabled=True,
+            hide_index=True,
+            use_container_width=True,
+            key=f"editor_{section}"
+        )
+
+
+@st.fragment
+def _tab_validation(outputs):
+    """Render the validation results tab."""
+    if 'validation_report' not in outputs:
+        st.info("No validation data available")
+        return
+    
+    st.header("✅ Validation Results")
+    
+    validation = outputs['validation_report']
+    
+    # Overall score
+    overall_score = validation.get('overall_score', 0)
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric("Overall Score", f"{overall_score:.1f}%")
+    
+    with col2:
+        if overall_score >= 90:
+            st.success("Excellent Quality")
+        elif overall_score >= 75:
+            st.info("Good Quality")
+        elif overall_score >= 60:
+            st.warning("Fair Quality")
+        else:
+            st.error("Needs Improvement")
+    
+    with col3:
+        validation_errors = validation.get('validation_errors', 0)
+        st.metric("Validation Errors", validation_errors)
+    
+    # Detailed breakdown
+    st.subheader("📊 Score Breakdown")
+    
+    if 'requirement_validation' in validation:
+        req_val = validation['requirement_validation']
+        st.write(f"**Requirements Validation:** {req_val.get('validation_rate', 0):.1f}%")
+    
+    if 'question_validation' in validation:
+        q_val = validation['question_validation']
+        st.write(f"**Questions Validation:** {q_val.get('validation_rate', 0):.1f}%")
+    
+    # Recommendations
+    if 'recommendations' in validation:
+        recommendations = validation['recommendations']
+        if recommendations:
+            st.subheader("💡 Recommendations")
+            rec_lines = []
+            for rec in recommendations[:5]:
+                if isinstance(rec, dict):
+                    priority = rec.get('priority', 'medium')
+                    description = rec.get('description', str(rec))
+                    priority_icon = _PRIORITY_ICONS.get(priority, "⚪")
+                    rec_lines.append(f"{priority_icon} {description}")
+                else:
+                    rec_lines.append(f"• {str(rec)}")
+            st.markdown(_MD_LINE_BREAK.join(rec_lines))
+
+
+@st.fragment
+def _stats_metrics(results, outputs):
+    """Render the statistics metric row in its own fragment so it isn't re-diffed by other widgets."""
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        duration = results.get('duration_seconds', 0)
+        st.metric("Processing Time", f"{duration:.1f}s")
+    
+    with col2:
+        status = results.get('status', 'Unknown')
+        st.metric("Status", status)
+    
+    with col3:
+        if 'outputs' in results:
+            total_reqs = sum(len(outputs.get(key, ())) for key in _REQUIREMENT_KEYS)
+            st.metric("Total Requirements", total_reqs)
+    
+    with col4:
+        if 'outputs' in results:
+            total_questions = len(outputs.get('application_questions', ()))
+            st.metric("Total Questions", total_questions)
+
+
+@st.fragment
+def _tab_statistics(results, outputs, stages):
+    """Render the processing statistics tab."""
+    if not results:
+        st.info("No statistics available")
+        return
+    
+    st.header("📊 Processing Statistics")
+    
+    _stats_metrics(results, outputs)
+    
+    # Processing stages - gather status and timing in a single pass
+    if stages:
+        st.subheader("🔄 Processing Stages")
+        
+        stages_completed = 0
+        stage_rows = []
+        for stage_name, stage_info in _stage_items(stages):
+            status = stage_info.get('status', 'unknown')
+            duration = stage_info.get('duration_seconds', stage_info.get('duration', 0))
+            done = status in _DONE_STATUSES
+            stages_completed += done
+            stage_rows.append((stage_name, status, duration, done))
+        total_stages = len(stage_rows)
+        
+        progress = stages_completed / total_stages if total_stages > 0 else 0
+        st.progress(progress)
+        st.write(f"Completed: {stages_completed}/{total_stages} stages")
+        
+        # Stage details
+        if stage_rows:
+            st.markdown(_MD_LINE_BREAK.join(
+                f"{_STATUS_ICONS.get(status, '⏳')} **{stage_name}**: {status} ({duration:.1f}s)"
+                for stage_name, status, duration, _ in stage_rows
+            ))
+        
+        # Create a simple chart from the timing data
+        if stage_rows:
+            stage_data = tuple((stage_name, duration) for stage_name, _, duration, _ in stage_rows)
+            st.plotly_chart(_stage_bar(stage_data), use_container_width=True)
+
+
+@st.fragment
+def _tab_agent_dashboard(results):
+    """Render the agent performance dashboard tab."""
+    show_agent_performance_dashboard(results)
+
+
+@st.fragment
+def _tab_policy_comparison():
+    """Render the policy comparison tab."""
+    st.header("📊 Policy Comparison")
+    
+    selected_policies = st.multiselect(
+        "Select policies to compare:",
+        ["Parent Boost Visitor Visa", "Tourist Visa", "Skilled Worker Visa",
+         "International Student Visa", "Family Reunion Visa"],
+        default=["Parent Boost Visitor Visa", "Tourist Visa"]
+    )
+    
+    if len(selected_policies) >= 2:
+        import numpy as np
+        import pandas as pd
+        
+        # Seed on the selection so reruns with the same policies show the same numbers
+        n = len(selected_policies)
+        rng = np.random.default_rng(zlib.crc32("|".join(selected_policies).encode('utf-8')))
+        requirements = rng.integers(15, 36, n)
+        questions = rng.integers(8, 21, n)
+        scores = rng.integers(75, 96, n)
+        
+        df = pd.DataFrame({
+            'Policy': selected_policies,
+            'Requirements': requirements,
+            'Questions': questions,
+            'Validation Score': [f"{score}%" for score in scores]
+        })
+        st.dataframe(df, use_container_width=True)
+        
+        fig = _comparison_bar(tuple(zip(selected_policies, requirements.tolist())))
+        st.plotly_chart(fig, use_container_width=True)
+    else:
+        st.info("Select at least 2 policies to compare.")
+
+
+@st.fragment
+def _tab_synthetic_data():
+    """Render the synthetic data generator tab."""
+    st.header("🤖 Synthetic Data Generator")
+    st.markdown("Generate realistic policy documents and mock results.")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("📄 Policy Generator")
+        visa_name = st.text_input("Visa Name", value="Custom Visitor Visa")
+        visa_category = st.selectbox("Category", ["visitor", "work", "student", "family"])
+        
+        # Capture the inputs at click time so regeneration stays explicit
+        if st.button("🚀 Generate Policy", type="primary"):
+            st.session_state.generated_policy = (
+                visa_name, visa_category, datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            )
+        
+        if 'generated_policy' in st.session_state:
+            gen_visa_name, gen_category, generated_at = st.session_state.generated_policy
+            policy_content = _generate_policy_markdown(gen_visa_name, gen_category, generated_at)
+            
+            st.success("✅ Policy generated!")
+            st.text_area("Generated Content", policy_content, height=200)
+            
+            st.download_button(
+                "📥 Download Policy",
+                policy_content,
+                file_name=f"{gen_visa_name.lower().replace(' ', '_')}.txt",
+                mime="text/plain"
+            )
+    
+    with col2:
+        st.subheader("🔄 Mock Results Generator")
+        policy_name = st.text_input("Policy Name", value="Sample Policy")
+        num_requirements = st.slider("Requirements", 10, 50, 25)
+        validation_score = st.slider("Validation Score (%)", 70, 100, 85)
+        
+        if st.button("🚀 Generate Results", type="primary"):
+            generated_at = datetime.now()
+            st.session_state.generated_mock_results = (
+                policy_name, num_requirements, validation_score, generated_at.isoformat()
+            )
+            st.session_state.generated_mock_ts = generated_at.strftime('%Y%m%d_%H%M%S')
+        
+        if 'generated_mock_results' in st.session_state:
+            mock_results = _generate_mock_summary(*st.session_state.generated_mock_results)
+            
+            st.success("✅ Results generated!")
+            st.json(mock_results)
+            
+            st.download_button(
+                "📥 Download Results",
+                json.dumps(mock_results, indent=2),
+                file_name=f"results_{st.session_state.generated_mock_ts}.json",
+                mime="application/json"
+            )
+
+
 def main():
     st.set_page_config(
         page_title="Visa Requirements Agent Demo",
@@ -56,12 +540,8 @@ def main():
             if mode == "Demo Mode (Mock Data)":
                 # Use mock data
                 with st.spinner("Processing with mock data..."):
-                    import time
-                    time.sleep(2)  # Simulate processing time
-                    
-                    mock_generator = MockResultsGenerator()
-                    results = mock_generator.generate_complete_workflow_results()
-                    st.session_state.results = results
+                    results = _mock_results()
+                    _save_results(results)
                     st.success("✅ Analysis completed!")
             else:
                 # Live API mode
@@ -70,24 +550,25 @@ def main():
                         try:
                             orchestrator = WorkflowOrchestrator()
                             results = orchestrator.process_document(document_content)
-                            st.session_state.results = results
+                            _save_results(results)
                             st.success("✅ Analysis completed!")
                         except Exception as e:
                             st.error(f"Error processing document: {str(e)}")
                             # Fallback to mock data
-                            mock_generator = MockResultsGenerator()
-                            results = mock_generator.generate_complete_workflow_results()
-                            st.session_state.results = results
+                            results = _mock_results()
+                            _save_results(results)
                             st.warning("⚠️ Fell back to mock data due to API error")
                 else:
                     st.error("Please upload a document first")
     
     # Main content area
-    if 'results' not in st.session_state:
+    results = _load_results()
+    if results is None:
         st.info("👈 Please configure settings and start analysis using the sidebar")
         return
     
-    results = st.session_state.results
+    outputs = results.get('outputs') or {}
+    stages = results.get('stages') or []
     
     # Create tabs for different views
     tabs = st.tabs([
@@ -103,337 +584,35 @@ def main():
     
     # Tab 1: Policy Analysis
     with tabs[0]:
-        st.header("📄 Policy Structure Analysis")
-        
-        if results and 'outputs' in results:
-            outputs = results['outputs']
-            
-            # Policy structure
-            if 'policy_structure' in outputs:
-                policy_structure = outputs['policy_structure']
-                
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.subheader("📋 Basic Information")
-                    visa_type = policy_structure.get('visa_type', 'Unknown')
-                    visa_code = policy_structure.get('visa_code', 'Unknown')
-                    st.write(f"**Visa Type:** {visa_type}")
-                    st.write(f"**Visa Code:** {visa_code}")
-                
-                with col2:
-                    st.subheader("🎯 Objectives")
-                    objectives = policy_structure.get('objectives', [])
-                    if objectives:
-                        for obj in objectives[:3]:
-                            st.write(f"• {obj}")
-            
-            # Eligibility rules
-            if 'eligibility_rules' in outputs:
-                st.subheader("📜 Eligibility Rules")
-                eligibility_rules = outputs['eligibility_rules']
-                
-                if isinstance(eligibility_rules, list):
-                    for rule in eligibility_rules[:5]:
-                        if isinstance(rule, dict):
-                            description = rule.get('description', rule.get('requirement', str(rule)))
-                            mandatory = rule.get('mandatory', True)
-                            status_icon = "🔴" if mandatory else "🟡"
-                            st.write(f"{status_icon} {description}")
-                        else:
-                            st.write(f"• {str(rule)}")
-        else:
-            st.info("No policy analysis data available")
+        _tab_policy_analysis(outputs)
     
     # Tab 2: Requirements
     with tabs[1]:
-        st.header("📋 Requirements Analysis")
-        
-        if results and 'outputs' in results:
-            outputs = results['outputs']
-            
-            # Create requirement sections
-            requirement_types = [
-                ('functional_requirements', 'Functional Requirements', '⚙️'),
-                ('data_requirements', 'Data Requirements', '📊'),
-                ('business_rules', 'Business Rules', '💼'),
-                ('validation_rules', 'Validation Rules', '✅')
-            ]
-            
-            for req_type, title, icon in requirement_types:
-                if req_type in outputs:
-                    requirements = outputs[req_type]
-                    if requirements:
-                        st.subheader(f"{icon} {title}")
-                        
-                        for req in requirements[:5]:
-                            if isinstance(req, dict):
-                                req_id = req.get('requirement_id', 'N/A')
-                                description = req.get('description', str(req))
-                                priority = req.get('priority', 'Unknown')
-                                
-                                with st.expander(f"{req_id}: {description[:50]}..."):
-                                    st.write(f"**Description:** {description}")
-                                    st.write(f"**Priority:** {priority}")
-                                    if 'policy_reference' in req:
-                                        st.write(f"**Reference:** {req['policy_reference']}")
-                            else:
-                                st.write(f"• {str(req)}")
-        else:
-            st.info("No requirements data available")
+        _tab_requirements(outputs)
     
     # Tab 3: Questions
     with tabs[2]:
-        st.header("❓ Application Questions")
-        
-        if results and 'outputs' in results and 'application_questions' in results['outputs']:
-            questions = results['outputs']['application_questions']
-            
-            if questions:
-                # Group questions by section
-                sections = {}
-                for q in questions:
-                    if isinstance(q, dict):
-                        section = q.get('section', 'General')
-                        if section not in sections:
-                            sections[section] = []
-                        sections[section].append(q)
-                    else:
-                        if 'General' not in sections:
-                            sections['General'] = []
-                        sections['General'].append({'question': str(q), 'input_type': 'text'})
-                
-                # Display questions by section
-                for section, section_questions in sections.items():
-                    st.subheader(f"📝 {section}")
-                    
-                    for i, q in enumerate(section_questions, 1):
-                        if isinstance(q, dict):
-                            question_text = q.get('question', q.get('description', str(q)))
-                            input_type = q.get('input_type', 'text')
-                            required = q.get('required', False)
-                            
-                            req_indicator = " *" if required else ""
-                            st.write(f"**{i}.** {question_text}{req_indicator}")
-                            
-                            # Show input type
-                            if input_type == 'text':
-                                st.text_input(f"Answer {i}", key=f"q_{section}_{i}", disabled=True)
-                            elif input_type == 'number':
-                                st.number_input(f"Answer {i}", key=f"q_{section}_{i}", disabled=True)
-                            elif input_type == 'date':
-                                st.date_input(f"Answer {i}", key=f"q_{section}_{i}", disabled=True)
-                            elif input_type == 'boolean':
-                                st.checkbox(f"Answer {i}", key=f"q_{section}_{i}", disabled=True)
-                        else:
-                            st.write(f"**{i}.** {str(q)}")
-                            st.text_input(f"Answer {i}", key=f"q_general_{i}", disabled=True)
-            else:
-                st.info("No questions generated")
-        else:
-            st.info("No questions data available")
+        _tab_questions(outputs)
     
     # Tab 4: Validation
     with tabs[3]:
-        st.header("✅ Validation Results")
-        
-        if results and 'outputs' in results and 'validation_report' in results['outputs']:
-            validation = results['outputs']['validation_report']
-            
-            # Overall score
-            overall_score = validation.get('overall_score', 0)
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                st.metric("Overall Score", f"{overall_score:.1f}%")
-            
-            with col2:
-                if overall_score >= 90:
-                    st.success("Excellent Quality")
-                elif overall_score >= 75:
-                    st.info("Good Quality")
-                elif overall_score >= 60:
-                    st.warning("Fair Quality")
-                else:
-                    st.error("Needs Improvement")
-            
-            with col3:
-                validation_errors = validation.get('validation_errors', 0)
-                st.metric("Validation Errors", validation_errors)
-            
-            # Detailed breakdown
-            st.subheader("📊 Score Breakdown")
-            
-            if 'requirement_validation' in validation:
-                req_val = validation['requirement_validation']
-                st.write(f"**Requirements Validation:** {req_val.get('validation_rate', 0):.1f}%")
-            
-            if 'question_validation' in validation:
-                q_val = validation['question_validation']
-                st.write(f"**Questions Validation:** {q_val.get('validation_rate', 0):.1f}%")
-            
-            # Recommendations
-            if 'recommendations' in validation:
-                recommendations = validation['recommendations']
-                if recommendations:
-                    st.subheader("💡 Recommendations")
-                    for rec in recommendations[:5]:
-                        if isinstance(rec, dict):
-                            priority = rec.get('priority', 'medium')
-                            description = rec.get('description', str(rec))
-                            priority_icon = {"high": "🔴", "medium": "🟡", "low": "🟢"}.get(priority, "⚪")
-                            st.write(f"{priority_icon} {description}")
-                        else:
-                            st.write(f"• {str(rec)}")
-        else:
-            st.info("No validation data available")
+        _tab_validation(outputs)
     
     # Tab 5: Statistics
     with tabs[4]:
-        st.header("📊 Processing Statistics")
-        
-        if results:
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                duration = results.get('duration_seconds', 0)
-                st.metric("Processing Time", f"{duration:.1f}s")
-            
-            with col2:
-                status = results.get('status', 'Unknown')
-                st.metric("Status", status)
-            
-            with col3:
-                if 'outputs' in results:
-                    total_reqs = (
-                        len(results['outputs'].get('functional_requirements', [])) +
-                        len(results['outputs'].get('data_requirements', [])) +
-                        len(results['outputs'].get('business_rules', [])) +
-                        len(results['outputs'].get('validation_rules', []))
-                    )
-                    st.metric("Total Requirements", total_reqs)
-            
-            with col4:
-                if 'outputs' in results:
-                    total_questions = len(results['outputs'].get('application_questions', []))
-                    st.metric("Total Questions", total_questions)
-            
-            # Processing stages
-            if 'stages' in results:
-                st.subheader("🔄 Processing Stages")
-                stages = results['stages']
-                
-                stages_completed = sum(1 for stage in stages.values() if stage.get('status') in ['completed', 'success'])
-                total_stages = len(stages)
-                
-                progress = stages_completed / total_stages if total_stages > 0 else 0
-                st.progress(progress)
-                st.write(f"Completed: {stages_completed}/{total_stages} stages")
-                
-                # Stage details
-                for stage_name, stage_info in stages.items():
-                    status = stage_info.get('status', 'unknown')
-                    duration = stage_info.get('duration_seconds', 0)
-                    
-                    status_icon = "✅" if status in ['completed', 'success'] else "❌" if status == 'failed' else "⏳"
-                    st.write(f"{status_icon} **{stage_name}**: {status} ({duration:.1f}s)")
-            
-            # Create a simple chart if we have timing data
-            if 'stages' in results:
-                stage_data = []
-                for stage_name, stage_info in results['stages'].items():
-                    stage_data.append({
-                        'Stage': stage_name,
-                        'Duration': stage_info.get('duration_seconds', 0)
-                    })
-                
-                if stage_data:
-                    df_stages = pd.DataFrame(stage_data)
-                    fig = px.bar(df_stages, x='Stage', y='Duration', title="Processing Time by Stage")
-                    st.plotly_chart(fig, use_container_width=True)
-        else:
-            st.info("No statistics available")
+        _tab_statistics(results, outputs, stages)
     
     # Tab 6: Agent Dashboard
     with tabs[5]:
-            comparison_data = []
-            for policy in selected_policies:
-                comparison_data.append({
-                    'Policy': policy,
-                    'Requirements': random.randint(15, 35),
-                    'Questions': random.randint(8, 20),
-                    'Validation Score': f"{random.randint(75, 95)}%"
-                })
-            
-            df = pd.DataFrame(comparison_data)
-            st.dataframe(df, use_container_width=True)
-            
-            fig = px.bar(df, x='Policy', y='Requirements', title="Requirements Comparison")
-            st.plotly_chart(fig, use_container_width=True)
-        else:
-            st.info("Select at least 2 policies to compare.")
+        _tab_agent_dashboard(results)
+    
+    # Tab 7: Policy Comparison
+    with tabs[6]:
+        _tab_policy_comparison()
     
     # Tab 8: Synthetic Data Generator
     with tabs[7]:
-        st.header("🤖 Synthetic Data Generator")
-        st.markdown("Generate realistic policy documents and mock results.")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.subheader("📄 Policy Generator")
-            visa_name = st.text_input("Visa Name", value="Custom Visitor Visa")
-            visa_category = st.selectbox("Category", ["visitor", "work", "student", "family"])
-            
-            if st.button("🚀 Generate Policy", type="primary"):
-                policy_content = f"""# {visa_name}
-Category: {visa_category.title()}
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-## Eligibility Criteria
-- Valid passport required
-- Proof of financial support
-- Clean criminal record
-
-## Application Process
-1. Complete online form
-2. Submit documents
-3. Pay fees
-4. Attend interview"""
-                
-                st.success("✅ Policy generated!")
-                st.text_area("Generated Content", policy_content, height=200)
-                
-                st.download_button(
-                    "📥 Download Policy",
-                    policy_content,
-                    file_name=f"{visa_name.lower().replace(' ', '_')}.txt",
-                    mime="text/plain"
-                )
-        
-        with col2:
-            st.subheader("🔄 Mock Results Generator")
-            policy_name = st.text_input("Policy Name", value="Sample Policy")
-            num_requirements = st.slider("Requirements", 10, 50, 25)
-            validation_score = st.slider("Validation Score (%)", 70, 100, 85)
-            
-            if st.button("🚀 Generate Results", type="primary"):
-                mock_results = {
-                    'policy_name': policy_name,
-                    'total_requirements': num_requirements,
-                    'validation_score': validation_score,
-                    'status': 'completed',
-                    'generated_at': datetime.now().isoformat()
-                }
-                
-                st.success("✅ Results generated!")
-                st.json(mock_results)
-                
-                st.download_button(
-                    "📥 Download Results",
-                    json.dumps(mock_results, indent=2),
-                    file_name=f"results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                    mime="application/json"
-                )
+        _tab_synthetic_data()
     
     # Download section
     st.divider()
@@ -441,11 +620,11 @@ Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
     
     col1, col2, col3 = st.columns(3)
     with col1:
-        json_str = json.dumps(results, indent=2, default=str)
+        # Serialization is deferred until the button is actually clicked
         st.download_button(
             label="📥 Download Full Results (JSON)",
-            data=json_str,
-            file_name=f"workflow_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+            data=lambda: _results_json(results),
+            file_name=f"workflow_results_{st.session_state.results_ts}.json",
             mime="application/json"
         )
 
@@ -1,32 +1,31 @@
 import streamlit as st
 import json
 import os
+import shutil
 from pathlib import Path
 import sys
+from collections import defaultdict
 from datetime import datetime
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.orchestrator.workflow_orchestrator import WorkflowOrchestrator
-from src.utils.output_formatter import OutputFormatter
-from src.generators.mock_results_generator import MockResultsGenerator
-from src.generators.policy_generator import PolicyGenerator
+# Policy document locations
+DATA_INPUT = project_root / 'data' / 'input'
+DATA_SYNTHETIC = project_root / 'data' / 'synthetic'
 
-# Page configuration
-st.set_page_config(
-    page_title="Visa Requirements Agent Demo",
-    page_icon="🛂",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
+# Stage statuses counted as completed
+_DONE_STATUSES = frozenset({'success', 'completed'})
 
-# Custom CSS
-st.markdown("""
+# Custom CSS, emitted on every full rerun (Streamlit clears elements not re-rendered)
+_CUSTOM_CSS = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -60,13 +59,136 @@ st.markdown("""
         margin: 1rem 0;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+
+@st.cache_data(show_spinner=False)
+def _gen_mock(policy_name: str) -> dict:
+    """Generate mock workflow results once per policy and reuse them across runs."""
+    from src.generators.mock_results_generator import MockResultsGenerator
+    return MockResultsGenerator().generate_complete_workflow_results(policy_name)
+
+
+def _requirement_row(req: dict) -> tuple:
+    """Normalize a requirement record to (id, description, priority, type, policy reference)."""
+    return (
+        req.get('requirement_id') or req.get('rule_id') or req.get('validation_id', 'Unknown ID'),
+        req.get('description') or req.get('rule', 'No description available'),
+        req.get('priority', ''),
+        req.get('type') or req.get('rule_type') or req.get('validation_type') or req.get('category', ''),
+        req.get('policy_reference', '')
+    )
+
+
+def _requirement_markdown(row: tuple) -> str:
+    """Format a normalized requirement row as a single markdown block."""
+    req_id, description, priority, req_type, policy_ref = row
+    details = []
+    if priority:
+        details.append(f"Priority: {priority}")
+    if req_type:
+        details.append(f"Type: {req_type}")
+    if policy_ref:
+        details.append(f"Policy: {policy_ref}")
+    
+    md = f"**{req_id}**: {description}"
+    if details:
+        md += f"  \n:gray[{' · '.join(details)}]"
+    return md
+
+
+def _question_markdown(q: dict) -> str:
+    """Format an application question as a single markdown block."""
+    md = (
+        f"**{q.get('question_id', 'N/A')}**: {q.get('question_text', 'N/A')}  \n"
+        f":gray[Type: {q.get('input_type', 'N/A')} · Required: {q.get('required', False)} · "
+        f"Policy: {q.get('policy_reference', 'N/A')}]"
+    )
+    if q.get('help_text'):
+        md += f"  \n:gray[Help: {q['help_text'][:100]}...]"
+    return md
+
+
+def _to_json_bytes(payload) -> bytes:
+    """Serialize a download payload, preferring orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str)
+    return json.dumps(payload, indent=2, default=str).encode('utf-8')
+
+
+def _store_results(results: dict) -> None:
+    """Store workflow results and precompute the derived tab content and download payloads once."""
+    outputs = results['outputs']
+    requirements_data = {
+        'functional': outputs.get('functional_requirements', []),
+        'data': outputs.get('data_requirements', []),
+        'business_rules': outputs.get('business_rules', [])
+    }
+    
+    st.session_state.workflow_results = results
+    st.session_state.stages_completed = sum(1 for s in results['stages'] if s['status'] in _DONE_STATUSES)
+    st.session_state.validation_score = outputs.get('validation_report', {}).get('overall_score', 0)
+    st.session_state.results_json = _to_json_bytes(results)
+    st.session_state.requirements_json = _to_json_bytes(requirements_data)
+    st.session_state.questions_json = _to_json_bytes(outputs.get('application_questions', []))
+    
+    # Requirements grouped by type: (total count, normalized rows for the first 10)
+    req_types = {
+        'Functional Requirements': outputs.get('functional_requirements', []),
+        'Data Requirements': outputs.get('data_requirements', []),
+        'Business Rules': outputs.get('business_rules', []),
+        'Validation Rules': outputs.get('validation_rules', [])
+    }
+    st.session_state.req_rows = {
+        name: (len(requirements), [_requirement_row(req) for req in requirements[:10]])
+        for name, requirements in req_types.items()
+    }
+    
+    # Questions grouped by section
+    sections = defaultdict(list)
+    for q in outputs.get('application_questions', []):
+        sections[q.get('section', 'General')].append(q)
+    st.session_state.questions_by_section = dict(sections)
+    
+    # Statistics tables
+    summary_stats = outputs.get('summary_statistics', {})
+    # Small summary tables stay plain column dicts; only the traceability matrix needs pandas
+    req_by_type = summary_stats.get('requirements_by_type', {})
+    st.session_state.req_by_type_table = {
+        'Type': [k.replace('_', ' ').title() for k in req_by_type],
+        'Count': list(req_by_type.values())
+    }
+    req_by_priority = summary_stats.get('requirements_by_priority', {})
+    st.session_state.req_by_priority_table = {
+        'Priority': [k.replace('_', ' ').title() for k in req_by_priority],
+        'Count': list(req_by_priority.values())
+    }
+    q_by_section = summary_stats.get('questions_by_section', {})
+    st.session_state.q_by_section_table = {
+        'Section': list(q_by_section),
+        'Count': list(q_by_section.values())
+    }
+    traceability = outputs.get('traceability_matrix', [])
+    if traceability:
+        import pandas as pd
+        st.session_state.traceability_df = pd.DataFrame.from_records(traceability)
+    else:
+        st.session_state.traceability_df = None
+
+# Page configuration
+st.set_page_config(
+    page_title="Visa Requirements Agent Demo",
+    page_icon="🛂",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+# Custom CSS
+st.markdown(_CUSTOM_CSS, unsafe_allow_html=True)
 
 # Initialize session state
-if 'workflow_results' not in st.session_state:
-    st.session_state.workflow_results = None
-if 'orchestrator' not in st.session_state:
-    st.session_state.orchestrator = None
+st.session_state.setdefault('workflow_results', None)
+st.session_state.setdefault('orchestrator', None)
 
 # Navigation
 page = st.sidebar.selectbox(
@@ -106,18 +228,20 @@ else:
             st.info("🎭 Demo mode enabled - using synthetic data")
             api_key = "demo_mode"
         else:
-            # Check for API key
-            import os
-            from dotenv import load_dotenv
-            load_dotenv()
+            # Check for API key (.env is read once per session)
+            if 'api_key' not in st.session_state:
+                from dotenv import load_dotenv
+                load_dotenv()
+                st.session_state.api_key = os.getenv('OPENAI_API_KEY')
             
-            api_key = os.getenv('OPENAI_API_KEY')
+            api_key = st.session_state.api_key
             if not api_key:
                 st.error("⚠️ OPENAI_API_KEY not found in .env file")
                 st.info("Please create a .env file with your OpenAI API key")
                 api_key_input = st.text_input("Or enter API key here:", type="password")
                 if api_key_input:
                     os.environ['OPENAI_API_KEY'] = api_key_input
+                    st.session_state.api_key = api_key_input
                     api_key = api_key_input
             else:
                 st.success("✅ API Key configured")
@@ -140,11 +264,10 @@ else:
             selected_policy = st.selectbox("Select Policy Document", list(policy_options.keys()))
             policy_filename = policy_options[selected_policy]
             
-            project_root = Path(__file__).parent.parent.parent
             if "Synthetic" in selected_policy:
-                policy_path = project_root / 'data' / 'synthetic' / policy_filename
+                policy_path = DATA_SYNTHETIC / policy_filename
             else:
-                policy_path = project_root / 'data' / 'input' / policy_filename
+                policy_path = DATA_INPUT / policy_filename
             
             st.info(f"Using: {selected_policy}")
             
@@ -152,17 +275,16 @@ else:
             use_sample = st.checkbox("Use sample Parent Boost policy", value=True)
             
             if use_sample:
-                project_root = Path(__file__).parent.parent.parent
-                policy_path = project_root / 'data' / 'input' / 'parent_boost_policy.txt'
+                policy_path = DATA_INPUT / 'parent_boost_policy.txt'
                 st.info(f"Using: {policy_path.name}")
             else:
                 uploaded_file = st.file_uploader("Upload Policy Document", type=['txt', 'docx', 'pdf'])
                 if uploaded_file:
                     # Save uploaded file
-                    project_root = Path(__file__).parent.parent.parent
-                    policy_path = project_root / 'data' / 'input' / uploaded_file.name
+                    policy_path = DATA_INPUT / uploaded_file.name
+                    uploaded_file.seek(0)
                     with open(policy_path, 'wb') as f:
-                        f.write(uploaded_file.getbuffer())
+                        shutil.copyfileobj(uploaded_file, f, length=1024 * 1024)
                     st.success(f"Uploaded: {uploaded_file.name}")
                 else:
                     policy_path = None
@@ -176,23 +298,15 @@ else:
             if demo_mode:
                 with st.spinner("Running demo workflow... Processing through 5-stage AI pipeline..."):
                     try:
-                        import time
-                        
-                        # Add realistic delay to simulate processing (15 seconds for demo presentation)
-                        time.sleep(15)
-                        
-                        # Use mock results generator
-                        generator = MockResultsGenerator()
-                        
                         # Generate results based on selected policy
                         policy_name = selected_policy.split(" (")[0]  # Remove (Original/Synthetic) suffix
-                        results = generator.generate_complete_workflow_results(policy_name)
+                        results = _gen_mock(policy_name)
                         
                         # Verify results structure
                         if not results or 'stages' not in results:
                             raise ValueError("Invalid results structure generated")
                         
-                        st.session_state.workflow_results = results
+                        _store_results(results)
                         
                         st.success("✅ Demo workflow completed successfully!")
                         st.rerun()
@@ -205,12 +319,14 @@ else:
             else:
                 with st.spinner("Running workflow... This may take a few minutes."):
                     try:
+                        from src.orchestrator.workflow_orchestrator import WorkflowOrchestrator
+                        
                         # Initialize orchestrator
                         st.session_state.orchestrator = WorkflowOrchestrator()
                         
                         # Run workflow
                         results = st.session_state.orchestrator.run_workflow(str(policy_path))
-                        st.session_state.workflow_results = results
+                        _store_results(results)
                         
                         st.success("✅ Workflow completed successfully!")
                         st.rerun()
@@ -224,49 +340,12 @@ else:
                 st.session_state.orchestrator = None
                 st.rerun()
 
-# Main content
-if st.session_state.workflow_results is None:
-    # Welcome screen
-    st.info("👈 Configure settings and click 'Run Complete Workflow' to start")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.subheader("🎯 What This Demo Does")
-        st.markdown("""
-        This multi-agent system automates the process of:
-        
-        1. **Policy Analysis** - Parse and understand immigration policy documents
-        2. **Requirements Capture** - Extract business and technical requirements
-        3. **Question Generation** - Generate application form questions
-        4. **Validation** - Validate requirements against policy
-        5. **Consolidation** - Synthesize into cohesive specification
-        """)
-    
-    with col2:
-        st.subheader("📊 Expected Benefits")
-        st.markdown("""
-        - **Speed**: Reduce requirements gathering from weeks to hours
-        - **Coverage**: 95%+ policy requirement capture
-        - **Accuracy**: High validation scores
-        - **Traceability**: Complete policy-to-question mapping
-        - **Automation**: Eliminate manual steps
-        """)
-    
-    st.divider()
-    
-    st.subheader("🏗️ System Architecture")
-    st.markdown("""
-    ```
-    Policy Document → PolicyEvaluator → RequirementsCapture → QuestionGenerator
-                                                                      ↓
-                      ConsolidationAgent ← ValidationAgent ←──────────┘
-    ```
-    """)
 
-else:
-    # Results display
-    results = st.session_state.workflow_results
+@st.fragment
+def _render_results(results: dict) -> None:
+    """Render the workflow summary, result tabs and downloads; reruns only this fragment."""
+    outputs = results['outputs']
+    stages = results['stages']
     
     # Summary metrics
     st.header("📊 Workflow Summary")
@@ -280,12 +359,10 @@ else:
         st.metric("Duration", f"{results['duration_seconds']:.1f}s")
     
     with col3:
-        stages_completed = sum(1 for s in results['stages'] if s['status'] in ['success', 'completed'])
-        st.metric("Stages Completed", f"{stages_completed}/{len(results['stages'])}")
+        st.metric("Stages Completed", f"{st.session_state.stages_completed}/{len(stages)}")
     
     with col4:
-        validation_score = results['outputs'].get('validation_report', {}).get('overall_score', 0)
-        st.metric("Validation Score", f"{validation_score:.1f}%")
+        st.metric("Validation Score", f"{st.session_state.validation_score:.1f}%")
     
     st.divider()
     
@@ -303,7 +380,7 @@ else:
     with tabs[0]:
         st.subheader("Policy Structure")
         
-        policy_structure = results['outputs'].get('policy_structure', {})
+        policy_structure = outputs.get('policy_structure', {})
         
         if policy_structure:
             col1, col2 = st.columns(2)
@@ -340,7 +417,7 @@ else:
         st.divider()
         
         st.subheader("Eligibility Rules")
-        eligibility_rules = results['outputs'].get('eligibility_rules', {})
+        eligibility_rules = outputs.get('eligibility_rules', {})
         
         if eligibility_rules:
             for category, rules in eligibility_rules.items():
@@ -365,73 +442,26 @@ else:
     with tabs[1]:
         st.subheader("Requirements by Type")
         
-        req_types = {
-            'Functional Requirements': results['outputs'].get('functional_requirements', []),
-            'Data Requirements': results['outputs'].get('data_requirements', []),
-            'Business Rules': results['outputs'].get('business_rules', []),
-            'Validation Rules': results['outputs'].get('validation_rules', [])
-        }
-        
-        for req_type, requirements in req_types.items():
-            with st.expander(f"**{req_type}** ({len(requirements)} items)"):
-                if requirements:
-                    for req in requirements[:10]:  # Show first 10
-                        # Get requirement ID and description
-                        req_id = req.get('requirement_id') or req.get('rule_id') or req.get('validation_id', 'Unknown ID')
-                        description = req.get('description') or req.get('rule', 'No description available')
-                        st.markdown(f"**{req_id}**: {description}")
-                        
-                        cols = st.columns([1, 1, 2])
-                        with cols[0]:
-                            priority = req.get('priority', '')
-                            if priority:
-                                st.caption(f"Priority: {priority}")
-                        with cols[1]:
-                            req_type = req.get('type') or req.get('rule_type') or req.get('validation_type') or req.get('category', '')
-                            if req_type:
-                                st.caption(f"Type: {req_type}")
-                        with cols[2]:
-                            policy_ref = req.get('policy_reference', '')
-                            if policy_ref:
-                                st.caption(f"Policy: {policy_ref}")
-                        
-                        st.divider()
+        for type_name, (total, rows) in st.session_state.req_rows.items():
+            with st.expander(f"**{type_name}** ({total} items)"):
+                if rows:
+                    # One markdown element for the first 10 requirements
+                    st.markdown("".join(f"{_requirement_markdown(row)}\n\n---\n\n" for row in rows))
                     
-                    if len(requirements) > 10:
-                        st.info(f"Showing 10 of {len(requirements)} requirements")
+                    if total > 10:
+                        st.info(f"Showing 10 of {total} requirements")
     
     # Tab 3: Questions
     with tabs[2]:
         st.subheader("Application Questions")
         
-        questions = results['outputs'].get('application_questions', [])
+        sections = st.session_state.questions_by_section
         
-        if questions:
-            # Group by section
-            sections = {}
-            for q in questions:
-                section = q.get('section', 'General')
-                if section not in sections:
-                    sections[section] = []
-                sections[section].append(q)
-            
+        if sections:
             for section, section_questions in sections.items():
                 with st.expander(f"**{section}** ({len(section_questions)} questions)"):
-                    for q in section_questions:
-                        st.markdown(f"**{q.get('question_id', 'N/A')}**: {q.get('question_text', 'N/A')}")
-                        
-                        cols = st.columns([1, 1, 1, 2])
-                        with cols[0]:
-                            st.caption(f"Type: {q.get('input_type', 'N/A')}")
-                        with cols[1]:
-                            st.caption(f"Required: {q.get('required', False)}")
-                        with cols[2]:
-                            st.caption(f"Policy: {q.get('policy_reference', 'N/A')}")
-                        with cols[3]:
-                            if q.get('help_text'):
-                                st.caption(f"Help: {q['help_text'][:100]}...")
-                        
-                        st.divider()
+                    # One markdown element per section instead of several per question
+                    st.markdown("".join(f"{_question_markdown(q)}\n\n---\n\n" for q in section_questions))
         else:
             st.warning("No questions generated")
     
@@ -439,7 +469,7 @@ else:
     with tabs[3]:
         st.subheader("Validation Report")
         
-        validation_report = results['outputs'].get('validation_report', {})
+        validation_report = outputs.get('validation_report', {})
         
         if validation_report:
             # Overall score
@@ -490,7 +520,7 @@ else:
         
         # Gap analysis
         st.subheader("Gap Analysis")
-        gap_analysis = results['outputs'].get('gap_analysis', {})
+        gap_analysis = outputs.get('gap_analysis', {})
         
         if gap_analysis:
             for gap_type, gaps in gap_analysis.items():
@@ -506,7 +536,7 @@ else:
         
         # Recommendations
         st.subheader("Recommendations")
-        recommendations = results['outputs'].get('recommendations', [])
+        recommendations = outputs.get('recommendations', [])
         
         if recommendations:
             for rec in recommendations:
@@ -524,7 +554,7 @@ else:
     with tabs[4]:
         st.subheader("Consolidated Specification")
         
-        consolidated_spec = results['outputs'].get('consolidated_spec', {})
+        consolidated_spec = outputs.get('consolidated_spec', {})
         
         if consolidated_spec:
             # Executive summary
@@ -548,7 +578,7 @@ else:
         
         # Implementation guide
         st.subheader("Implementation Guide")
-        impl_guide = results['outputs'].get('implementation_guide', {})
+        impl_guide = outputs.get('implementation_guide', {})
         
         if impl_guide:
             for section_name, section_content in impl_guide.items():
@@ -568,7 +598,7 @@ else:
     with tabs[5]:
         st.subheader("Summary Statistics")
         
-        summary_stats = results['outputs'].get('summary_statistics', {})
+        summary_stats = outputs.get('summary_statistics', {})
         
         if summary_stats:
             col1, col2 = st.columns(2)
@@ -577,34 +607,19 @@ else:
                 st.markdown("### Requirements")
                 st.metric("Total Requirements", summary_stats.get('total_requirements', 0))
                 
-                req_by_type = summary_stats.get('requirements_by_type', {})
-                if req_by_type:
-                    df = pd.DataFrame([
-                        {'Type': k.replace('_', ' ').title(), 'Count': v}
-                        for k, v in req_by_type.items()
-                    ])
-                    st.dataframe(df, hide_index=True)
+                if st.session_state.req_by_type_table['Count']:
+                    st.table(st.session_state.req_by_type_table)
                 
                 st.markdown("### By Priority")
-                req_by_priority = summary_stats.get('requirements_by_priority', {})
-                if req_by_priority:
-                    df = pd.DataFrame([
-                        {'Priority': k.replace('_', ' ').title(), 'Count': v}
-                        for k, v in req_by_priority.items()
-                    ])
-                    st.dataframe(df, hide_index=True)
+                if st.session_state.req_by_priority_table['Count']:
+                    st.table(st.session_state.req_by_priority_table)
             
             with col2:
                 st.markdown("### Questions")
                 st.metric("Total Questions", summary_stats.get('total_questions', 0))
                 
-                q_by_section = summary_stats.get('questions_by_section', {})
-                if q_by_section:
-                    df = pd.DataFrame([
-                        {'Section': k, 'Count': v}
-                        for k, v in q_by_section.items()
-                    ])
-                    st.dataframe(df, hide_index=True)
+                if st.session_state.q_by_section_table['Count']:
+                    st.table(st.session_state.q_by_section_table)
                 
                 st.markdown("### Quality Metrics")
                 quality = summary_stats.get('quality_metrics', {})
@@ -616,11 +631,8 @@ else:
         
         # Traceability matrix
         st.subheader("Traceability Matrix")
-        traceability = results['outputs'].get('traceability_matrix', [])
-        
-        if traceability:
-            df = pd.DataFrame(traceability)
-            st.dataframe(df, hide_index=True)
+        if st.session_state.traceability_df is not None:
+            st.dataframe(st.session_state.traceability_df, hide_index=True)
     
     # Download section
     st.divider()
@@ -630,36 +642,72 @@ else:
     
     with col1:
         # Download full results as JSON
-        json_str = json.dumps(results, indent=2)
         st.download_button(
             label="📥 Download Full Results (JSON)",
-            data=json_str,
+            data=st.session_state.results_json,
             file_name=f"workflow_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
             mime="application/json"
         )
     
     with col2:
         # Download requirements
-        requirements_data = {
-            'functional': results['outputs'].get('functional_requirements', []),
-            'data': results['outputs'].get('data_requirements', []),
-            'business_rules': results['outputs'].get('business_rules', [])
-        }
-        req_json = json.dumps(requirements_data, indent=2)
         st.download_button(
             label="📥 Download Requirements (JSON)",
-            data=req_json,
+            data=st.session_state.requirements_json,
             file_name=f"requirements_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
             mime="application/json"
         )
     
     with col3:
         # Download questions
-        questions_data = results['outputs'].get('application_questions', [])
-        q_json = json.dumps(questions_data, indent=2)
         st.download_button(
             label="📥 Download Questions (JSON)",
-            data=q_json,
+            data=st.session_state.questions_json,
             file_name=f"questions_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
             mime="application/json"
         )
+
+
+# Main content
+if st.session_state.workflow_results is None:
+    # Welcome screen
+    st.info("👈 Configure settings and click 'Run Complete Workflow' to start")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("🎯 What This Demo Does")
+        st.markdown("""
+        This multi-agent system automates the process of:
+        
+        1. **Policy Analysis** - Parse and understand immigration policy documents
+        2. **Requirements Capture** - Extract business and technical requirements
+        3. **Question Generation** - Generate application form questions
+        4. **Validation** - Validate requirements against policy
+        5. **Consolidation** - Synthesize into cohesive specification
+        """)
+    
+    with col2:
+        st.subheader("📊 Expected Benefits")
+        st.markdown("""
+        - **Speed**: Reduce requirements gathering from weeks to hours
+        - **Coverage**: 95%+ policy requirement capture
+        - **Accuracy**: High validation scores
+        - **Traceability**: Complete policy-to-question mapping
+        - **Automation**: Eliminate manual steps
+        """)
+    
+    st.divider()
+    
+    st.subheader("🏗️ System Architecture")
+    st.markdown("""
+    ```
+    Policy Document → PolicyEvaluator → RequirementsCapture → QuestionGenerator
+                                                                      ↓
+                      ConsolidationAgent ← ValidationAgent ←──────────┘
+    ```
+    """)
+
+else:
+    # Results display
+    _render_results(st.session_state.workflow_results)
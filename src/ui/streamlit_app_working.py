@@ -5,9 +5,13 @@ import tempfile
 from pathlib import Path
 import sys
 from datetime import datetime
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+
+# Fast JSON serialization for downloads
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
@@ -20,6 +24,14 @@ from src.generators.policy_generator import PolicyGenerator
 from src.ui.enhanced_file_upload import show_enhanced_file_upload, get_document_content, get_document_path
 from src.ui.agent_dashboard import show_agent_performance_dashboard
 
+
+def _to_json_bytes(payload) -> bytes:
+    """Serialize a download payload, preferring orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str)
+    return json.dumps(payload, indent=2, default=str).encode('utf-8')
+
+
 # Page configuration
 st.set_page_config(
     page_title="Visa Requirements Agent Demo",
@@ -75,6 +87,7 @@ st.markdown("""
 st.markdown('<div class="main-header">🛂 Visa Requirements Agent Demo</div>', unsafe_allow_html=True)
 st.markdown('<div class="sub-header">Automated Requirements Capture for Immigration Policies</div>', unsafe_allow_html=True)
 
+
 # Initialize session state
 if 'workflow_results' not in st.session_state:
     st.session_state.workflow_results = None
@@ -85,30 +98,35 @@ if 'document_info' not in st.session_state:
 with st.sidebar:
     st.header("⚙️ Configuration")
     
-    # Demo mode toggle
+    # Demo mode toggle, outside the form so switching modes shows the key input at once
     demo_mode = st.toggle("Demo Mode", value=False, help="Use synthetic data for demonstration")
     
+    # API Configuration
+    st.subheader("🔑 API Configuration")
+    
+    # Check for API key in environment
+    api_key = os.getenv('OPENAI_API_KEY')
+    has_env_key = bool(api_key) and api_key != 'your_openai_api_key_here'
+    
+    api_key_input = ""
+    submitted = False
+    if not demo_mode and not has_env_key:
+        st.warning("⚠️ OpenAI API Key required")
+        # Batch the key input in a form so typing into it doesn't rerun the page
+        with st.form("config", clear_on_submit=False):
+            api_key_input = st.text_input("Enter OpenAI API Key", type="password")
+            submitted = st.form_submit_button("Apply")
+    
+    # Only mutate the environment when the form is submitted
+    if submitted and api_key_input:
+        os.environ['OPENAI_API_KEY'] = api_key_input
+        api_key = api_key_input
+    
     if demo_mode:
         st.info("🎭 Demo Mode: Using mock results for fast demonstration")
     else:
         st.info("🔴 Live API Mode: Using real OpenAI API calls")
-    
-    st.divider()
-    
-    # API Configuration
-    st.header("🔑 API Configuration")
-    
-    if not demo_mode:
-        # Check for API key in environment
-        api_key = os.getenv('OPENAI_API_KEY')
-        
-        if not api_key or api_key == 'your_openai_api_key_here':
-            st.warning("⚠️ OpenAI API Key required")
-            api_key_input = st.text_input("Enter OpenAI API Key", type="password")
-            if api_key_input:
-                os.environ['OPENAI_API_KEY'] = api_key_input
-                api_key = api_key_input
-        else:
+        if api_key and api_key != 'your_openai_api_key_here':
             st.success("✅ API Key configured")
     
     st.divider()
@@ -341,19 +359,24 @@ else:
         
         questions = results['outputs'].get('application_questions', [])
         if questions:
-            # Group by section
+            import pandas as pd
+            
+            # Group by section with a single pandas groupby (first-seen section order)
             sections = {}
-            for q in questions:
-                if isinstance(q, dict):
-                    section = q.get('section', 'Other')
-                    if section not in sections:
-                        sections[section] = []
-                    sections[section].append(q)
+            dict_questions = [q for q in questions if isinstance(q, dict)]
+            if dict_questions:
+                qdf = pd.DataFrame(dict_questions)
+                if 'section' in qdf:
+                    section_keys = qdf['section'].fillna('Other')
                 else:
-                    # Handle non-dict questions
-                    if 'Other' not in sections:
-                        sections['Other'] = []
-                    sections['Other'].append(q)
+                    section_keys = pd.Series('Other', index=qdf.index)
+                for section_name, group in qdf.groupby(section_keys, sort=False):
+                    sections[section_name] = [dict_questions[i] for i in group.index]
+
+            # Handle non-dict questions
+            other_questions = [q for q in questions if not isinstance(q, dict)]
+            if other_questions:
+                sections.setdefault('Other', []).extend(other_questions)
             
             for section_name, section_questions in sections.items():
                 with st.expander(f"{section_name} ({len(section_questions)} questions)", expanded=False):
@@ -442,6 +465,10 @@ else:
         
         summary_stats = results['outputs'].get('summary_statistics', {})
         if summary_stats:
+            # Deferred so runs without results never pay the plotly/pandas import cost
+            import pandas as pd
+            import plotly.express as px
+            
             # Requirements breakdown
             req_by_type = summary_stats.get('requirements_by_type', {})
             if req_by_type:
@@ -475,13 +502,13 @@ else:
     st.divider()
     st.header("💾 Download Results")
     
+    # Payloads are callables so serialization only happens when a button is clicked
     col1, col2, col3 = st.columns(3)
     with col1:
         # Full results download
-        json_str = json.dumps(results, indent=2, default=str)
         st.download_button(
             label="📥 Download Full Results (JSON)",
-            data=json_str,
+            data=lambda: _to_json_bytes(results),
             file_name=f"workflow_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
             mime="application/json"
         )
@@ -494,10 +521,9 @@ else:
             'business_rules': results['outputs'].get('business_rules', []),
             'validation_rules': results['outputs'].get('validation_rules', [])
         }
-        req_json = json.dumps(requirements_data, indent=2, default=str)
         st.download_button(
             label="📋 Download Requirements (JSON)",
-            data=req_json,
+            data=lambda: _to_json_bytes(requirements_data),
             file_name=f"requirements_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
             mime="application/json"
         )
@@ -508,10 +534,9 @@ else:
             'application_questions': results['outputs'].get('application_questions', []),
             'conditional_logic': results['outputs'].get('conditional_logic', {})
         }
-        q_json = json.dumps(questions_data, indent=2, default=str)
         st.download_button(
             label="❓ Download Questions (JSON)",
-            data=q_json,
+            data=lambda: _to_json_bytes(questions_data),
             file_name=f"questions_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
             mime="application/json"
         )
@@ -1,8 +1,92 @@
 import streamlit as st
-import plotly.graph_objects as go
-import plotly.express as px
+from bisect import bisect_right
+from collections import defaultdict, namedtuple
 import pandas as pd
-from typing import Dict, Any, List
+import numpy as np
+from typing import Dict, Any, List, Optional
+
+
+# Quality tiers, ordered to match bisect_right over the lower bounds of Fair/Good/Excellent
+_TIER_THRESHOLDS = (60, 75, 90)
+_TIERS = (
+    {'name': 'Poor', 'description': 'Significant issues requiring attention'},
+    {'name': 'Fair', 'description': 'Acceptable quality with some issues to address'},
+    {'name': 'Good', 'description': 'High quality with minor improvements needed'},
+    {'name': 'Excellent', 'description': 'Outstanding quality with minimal issues'}
+)
+
+_PRIORITY_ORDER = ('high', 'medium', 'low')
+_PRIORITY_SET = frozenset(_PRIORITY_ORDER)
+_RECS_PER_PAGE = 5
+
+_SEVERITY_ICON = {'high': '🔴', 'medium': '🟡', 'low': '🟢'}
+
+# Scores and sub-reports read from a validation report, extracted once per render
+_ExtractedScores = namedtuple('_ExtractedScores', [
+    'overall', 'req_rate', 'q_rate', 'cov_pct',
+    'req_validation', 'q_validation', 'coverage_analysis', 'req_coverage'
+])
+
+# Weighted scoring formula (Requirements: 30%, Questions: 30%, Coverage: 40%)
+_COMPONENT_NAMES = ('Requirements', 'Questions', 'Coverage')
+_WEIGHTS = np.array([0.30, 0.30, 0.40])
+_WEIGHT_LABELS = tuple(f"{weight * 100:.0f}%" for weight in _WEIGHTS)
+_COLORS = ('#FF6B6B', '#4ECDC4', '#45B7D1')
+
+# Static content for the methodology view
+_COMPONENTS_INFO = (
+    {
+        "name": "Requirements Validation (30%)",
+        "description": "Evaluates the quality and completeness of extracted requirements",
+        "criteria": [
+            "Requirement clarity and specificity",
+            "Policy reference accuracy", 
+            "Priority classification correctness",
+            "Completeness of requirement capture"
+        ]
+    },
+    {
+        "name": "Questions Validation (30%)",
+        "description": "Assesses the generated application questions",
+        "criteria": [
+            "Question relevance to policy requirements",
+            "Input type appropriateness",
+            "Question clarity and understandability",
+            "Coverage of all policy aspects"
+        ]
+    },
+    {
+        "name": "Coverage Analysis (40%)",
+        "description": "Measures how well the extraction covers the source policy",
+        "criteria": [
+            "Policy section coverage percentage",
+            "Requirement extraction completeness",
+            "Key policy element identification",
+            "Gap analysis accuracy"
+        ]
+    }
+)
+
+_TIERS_INFO = (
+    {"range": "90-100%", "tier": "Excellent", "color": "#28a745", "description": "Outstanding quality with minimal issues"},
+    {"range": "75-89%", "tier": "Good", "color": "#17a2b8", "description": "High quality with minor improvements needed"},
+    {"range": "60-74%", "tier": "Fair", "color": "#ffc107", "description": "Acceptable quality with some issues to address"},
+    {"range": "0-59%", "tier": "Poor", "color": "#dc3545", "description": "Significant issues requiring attention"}
+)
+
+_TIER_CARD_TMPL = """
+<div style="padding: 10px; margin: 5px 0; border-left: 4px solid {color}; background-color: rgba(0,0,0,0.05);">
+    <strong>{range}: {tier}</strong><br>
+    {description}
+</div>
+"""
+
+_VALIDATION_VIEWS = (
+    "📊 Score Breakdown",
+    "📋 Methodology",
+    "🔍 Detailed Results",
+    "💡 Recommendations"
+)
 
 
 def create_validation_dashboard(validation_report: Dict[str, Any]) -> None:
@@ -17,46 +101,53 @@ def create_validation_dashboard(validation_report: Dict[str, Any]) -> None:
         st.info("No validation report available")
         return
     
-    # Create tabs for different aspects of validation
-    val_tabs = st.tabs([
-        "📊 Score Breakdown",
-        "📋 Methodology", 
-        "🔍 Detailed Results",
-        "💡 Recommendations"
-    ])
+    scores = _extract_scores(validation_report)
     
-    # Tab 1: Score Breakdown
-    with val_tabs[0]:
-        show_score_breakdown(validation_report)
+    # Radio-based navigation so only the selected view is built on each rerun
+    view = st.radio("View", _VALIDATION_VIEWS, horizontal=True, key="val_tab",
+                    label_visibility="collapsed")
     
-    # Tab 2: Methodology
-    with val_tabs[1]:
+    if view == "📊 Score Breakdown":
+        show_score_breakdown(validation_report, scores)
+    elif view == "📋 Methodology":
         show_validation_methodology()
+    elif view == "🔍 Detailed Results":
+        show_detailed_results(validation_report, scores)
+    else:
+        show_recommendations(validation_report, scores)
+
+
+def _extract_scores(validation_report: Dict[str, Any]) -> _ExtractedScores:
+    """Extract the component scores and sub-reports from a validation report."""
     
-    # Tab 3: Detailed Results
-    with val_tabs[2]:
-        show_detailed_results(validation_report)
+    req_validation = validation_report.get('requirement_validation', {})
+    q_validation = validation_report.get('question_validation', {})
+    coverage_analysis = validation_report.get('coverage_analysis', {})
+    req_coverage = coverage_analysis.get('requirement_coverage', {})
     
-    # Tab 4: Recommendations
-    with val_tabs[3]:
-        show_recommendations(validation_report)
+    return _ExtractedScores(
+        overall=validation_report.get('overall_score', 0),
+        req_rate=req_validation.get('validation_rate', 0),
+        q_rate=q_validation.get('validation_rate', 0),
+        cov_pct=req_coverage.get('coverage_percentage', 0),
+        req_validation=req_validation,
+        q_validation=q_validation,
+        coverage_analysis=coverage_analysis,
+        req_coverage=req_coverage
+    )
 
 
-def show_score_breakdown(validation_report: Dict[str, Any]) -> None:
+@st.fragment
+def show_score_breakdown(validation_report: Dict[str, Any],
+                         scores: Optional[_ExtractedScores] = None) -> None:
     """Show detailed score breakdown with visualizations."""
     
     st.subheader("🔍 Validation Score Composition")
     
-    overall_score = validation_report.get('overall_score', 0)
-    
     # Extract component scores
-    req_validation = validation_report.get('requirement_validation', {})
-    q_validation = validation_report.get('question_validation', {})
-    coverage_analysis = validation_report.get('coverage_analysis', {})
-    
-    req_score = req_validation.get('validation_rate', 0)
-    q_score = q_validation.get('validation_rate', 0)
-    cov_score = coverage_analysis.get('requirement_coverage', {}).get('coverage_percentage', 0)
+    scores = scores or _extract_scores(validation_report)
+    overall_score = scores.overall
+    req_score, q_score, cov_score = scores.req_rate, scores.q_rate, scores.cov_pct
     
     # Overall score display
     col1, col2, col3 = st.columns(3)
@@ -78,164 +169,123 @@ def show_score_breakdown(validation_report: Dict[str, Any]) -> None:
     # Component breakdown with weights
     st.subheader("📊 Component Analysis")
     
-    # Weighted scoring formula (Requirements: 30%, Questions: 30%, Coverage: 40%)
-    weights = {'Requirements': 0.30, 'Questions': 0.30, 'Coverage': 0.40}
-    components = {
-        'Requirements': req_score,
-        'Questions': q_score, 
-        'Coverage': cov_score
-    }
-    
-    # Calculate weighted contributions
-    contributions = {}
-    for component, score in components.items():
-        contributions[component] = score * weights[component]
+    # Weighted contributions (vectorized over _COMPONENT_NAMES order)
+    component_scores = np.array([req_score, q_score, cov_score], dtype=float)
+    contributions = component_scores * _WEIGHTS
     
     # Create visualization
     col1, col2 = st.columns(2)
     
     with col1:
-        # Component scores chart
-        fig_scores = go.Figure(data=[
-            go.Bar(
-                x=list(components.keys()),
-                y=list(components.values()),
-                text=[f"{v:.1f}%" for v in components.values()],
-                textposition='auto',
-                marker_color=['#FF6B6B', '#4ECDC4', '#45B7D1']
-            )
-        ])
-        fig_scores.update_layout(
-            title="Component Scores",
-            yaxis_title="Score (%)",
-            showlegend=False,
-            height=400
-        )
-        st.plotly_chart(fig_scores, use_container_width=True)
+        # Component scores chart (native Vega-Lite bar chart)
+        st.markdown("**Component Scores**")
+        scores_df = pd.DataFrame({
+            'Component': _COMPONENT_NAMES,
+            'Score (%)': component_scores
+        })
+        st.bar_chart(scores_df, x='Component', y='Score (%)', color='Component', height=400)
     
     with col2:
         # Weighted contributions pie chart
-        fig_pie = go.Figure(data=[
-            go.Pie(
-                labels=list(contributions.keys()),
-                values=list(contributions.values()),
-                hole=0.4,
-                textinfo='label+percent',
-                marker_colors=['#FF6B6B', '#4ECDC4', '#45B7D1']
-            )
-        ])
-        fig_pie.update_layout(
-            title="Weighted Contributions to Overall Score",
-            height=400
-        )
-        st.plotly_chart(fig_pie, use_container_width=True)
+        fig_pie = _build_contrib_pie(tuple(zip(_COMPONENT_NAMES, contributions.tolist())))
+        st.plotly_chart(fig_pie, use_container_width=True, config={'displayModeBar': False})
     
     # Detailed component analysis
     st.subheader("🔍 Component Details")
     
-    for component, score in components.items():
-        weight = weights[component]
-        contribution = contributions[component]
-        
-        with st.expander(f"{component}: {score:.1f}% (Weight: {weight*100:.0f}%)"):
+    # Format each label once
+    score_labels = [f"{score:.1f}%" for score in component_scores]
+    contribution_labels = [f"{contribution:.1f}%" for contribution in contributions]
+    
+    for component, score_label, weight_label, contribution_label in zip(
+            _COMPONENT_NAMES, score_labels, _WEIGHT_LABELS, contribution_labels):
+        with st.expander(f"{component}: {score_label} (Weight: {weight_label})"):
             col1, col2, col3 = st.columns(3)
             
             with col1:
-                st.metric("Raw Score", f"{score:.1f}%")
+                st.metric("Raw Score", score_label)
             with col2:
-                st.metric("Weight", f"{weight*100:.0f}%")
+                st.metric("Weight", weight_label)
             with col3:
-                st.metric("Contribution", f"{contribution:.1f}%")
+                st.metric("Contribution", contribution_label)
             
             # Component-specific details
             if component == 'Requirements':
-                show_requirements_details(req_validation)
+                show_requirements_details(scores.req_validation)
             elif component == 'Questions':
-                show_questions_details(q_validation)
+                show_questions_details(scores.q_validation)
             elif component == 'Coverage':
-                show_coverage_details(coverage_analysis)
+                show_coverage_details(scores.coverage_analysis)
+
+
+@st.cache_data(max_entries=32)
+def _build_contrib_pie(contributions: tuple) -> Any:
+    """Build the weighted contributions pie chart from (component, contribution) pairs."""
+    import plotly.graph_objects as go
+    
+    names, values = zip(*contributions)
+    fig = go.Figure(data=[
+        go.Pie(
+            labels=names,
+            values=np.asarray(values, dtype=float),
+            hole=0.4,
+            textinfo='label+percent',
+            marker_colors=list(_COLORS)
+        )
+    ])
+    fig.update_layout(
+        title="Weighted Contributions to Overall Score",
+        height=400,
+        template='simple_white',
+        margin=dict(l=20, r=20, t=40, b=20)
+    )
+    return fig
 
 
 def show_validation_methodology() -> None:
     """Explain the validation methodology and scoring approach."""
     
     st.subheader("📋 Validation Methodology")
-    
-    st.markdown("""
-    ### 🎯 Scoring Formula
-    
-    The overall validation score is calculated using a **weighted average** of three key components:
-    
-    ```
-    Overall Score = (Requirements × 30%) + (Questions × 30%) + (Coverage × 40%)
-    ```
-    
-    ### 📊 Component Breakdown
-    """)
-    
-    # Component explanations
-    components_info = [
-        {
-            "name": "Requirements Validation (30%)",
-            "description": "Evaluates the quality and completeness of extracted requirements",
-            "criteria": [
-                "Requirement clarity and specificity",
-                "Policy reference accuracy", 
-                "Priority classification correctness",
-                "Completeness of requirement capture"
-            ]
-        },
-        {
-            "name": "Questions Validation (30%)",
-            "description": "Assesses the generated application questions",
-            "criteria": [
-                "Question relevance to policy requirements",
-                "Input type appropriateness",
-                "Question clarity and understandability",
-                "Coverage of all policy aspects"
-            ]
-        },
-        {
-            "name": "Coverage Analysis (40%)",
-            "description": "Measures how well the extraction covers the source policy",
-            "criteria": [
-                "Policy section coverage percentage",
-                "Requirement extraction completeness",
-                "Key policy element identification",
-                "Gap analysis accuracy"
-            ]
-        }
-    ]
-    
-    for component in components_info:
-        with st.expander(f"🔍 {component['name']}"):
-            st.write(component['description'])
-            st.write("**Evaluation Criteria:**")
-            for criterion in component['criteria']:
-                st.write(f"• {criterion}")
-    
-    # Quality tiers
-    st.subheader("🏆 Quality Tiers")
-    
-    tiers = [
-        {"range": "90-100%", "tier": "Excellent", "color": "#28a745", "description": "Outstanding quality with minimal issues"},
-        {"range": "75-89%", "tier": "Good", "color": "#17a2b8", "description": "High quality with minor improvements needed"},
-        {"range": "60-74%", "tier": "Fair", "color": "#ffc107", "description": "Acceptable quality with some issues to address"},
-        {"range": "0-59%", "tier": "Poor", "color": "#dc3545", "description": "Significant issues requiring attention"}
-    ]
-    
-    for tier in tiers:
-        st.markdown(f"""
-        <div style="padding: 10px; margin: 5px 0; border-left: 4px solid {tier['color']}; background-color: rgba(0,0,0,0.05);">
-            <strong>{tier['range']}: {tier['tier']}</strong><br>
-            {tier['description']}
-        </div>
-        """, unsafe_allow_html=True)
+    st.markdown(_methodology_html(), unsafe_allow_html=True)
+
+
+@st.cache_resource
+def _methodology_html() -> str:
+    """Build the static methodology content once; components collapse via <details>."""
+    
+    components = ''.join(
+        f"<details><summary>🔍 {component['name']}</summary>"
+        f"<p>{component['description']}</p>"
+        f"<strong>Evaluation Criteria:</strong>"
+        f"<ul>{''.join(f'<li>{criterion}</li>' for criterion in component['criteria'])}</ul>"
+        f"</details>\n"
+        for component in _COMPONENTS_INFO
+    )
+    tiers = ''.join(_TIER_CARD_TMPL.format(**tier) for tier in _TIERS_INFO)
+    
+    return f"""
+### 🎯 Scoring Formula
+
+The overall validation score is calculated using a **weighted average** of three key components:
+
+```
+Overall Score = (Requirements × 30%) + (Questions × 30%) + (Coverage × 40%)
+```
+
+### 📊 Component Breakdown
+
+{components}
+### 🏆 Quality Tiers
+{tiers}"""
 
 
-def show_detailed_results(validation_report: Dict[str, Any]) -> None:
+@st.fragment
+def show_detailed_results(validation_report: Dict[str, Any],
+                          scores: Optional[_ExtractedScores] = None) -> None:
     """Show detailed validation results and error analysis."""
     
+    scores = scores or _extract_scores(validation_report)
+    
     st.subheader("🔍 Detailed Validation Results")
     
     # Error analysis
@@ -243,29 +293,26 @@ def show_detailed_results(validation_report: Dict[str, Any]) -> None:
     if validation_errors:
         st.subheader("⚠️ Validation Issues")
         
-        for i, error in enumerate(validation_errors[:10], 1):  # Show top 10 errors
+        rows = []
+        for error in validation_errors[:10]:  # Show top 10 errors
             severity = error.get('severity', 'medium') if isinstance(error, dict) else 'medium'
             message = error.get('message', str(error)) if isinstance(error, dict) else str(error)
-            
-            severity_colors = {
-                'high': '🔴',
-                'medium': '🟡', 
-                'low': '🟢'
-            }
-            
-            icon = severity_colors.get(severity, '🟡')
-            st.write(f"{icon} **Issue {i}**: {message}")
+            rows.append({
+                'Severity': f"{_SEVERITY_ICON.get(severity, '🟡')} {severity}",
+                'Issue': message
+            })
+        
+        st.dataframe(pd.DataFrame(rows), use_container_width=True, hide_index=True)
     else:
         st.success("✅ No validation issues identified")
     
     # Coverage details
-    coverage_analysis = validation_report.get('coverage_analysis', {})
-    if coverage_analysis:
+    if scores.coverage_analysis:
         st.subheader("📊 Coverage Analysis")
         
-        req_coverage = coverage_analysis.get('requirement_coverage', {})
+        req_coverage = scores.req_coverage
         if req_coverage:
-            coverage_pct = req_coverage.get('coverage_percentage', 0)
+            coverage_pct = scores.cov_pct
             total_sections = req_coverage.get('total_sections', 0)
             covered_sections = req_coverage.get('covered_sections', 0)
             
@@ -297,31 +344,32 @@ def show_detailed_results(validation_report: Dict[str, Any]) -> None:
                 st.write(f"• {section}")
 
 
-def show_recommendations(validation_report: Dict[str, Any]) -> None:
+@st.fragment
+def show_recommendations(validation_report: Dict[str, Any],
+                         scores: Optional[_ExtractedScores] = None) -> None:
     """Show actionable recommendations based on validation results."""
     
     st.subheader("💡 Actionable Recommendations")
     
-    overall_score = validation_report.get('overall_score', 0)
     recommendations = validation_report.get('recommendations', [])
     
     # Generate recommendations based on score
-    generated_recommendations = generate_recommendations(validation_report)
-    all_recommendations = recommendations + generated_recommendations
+    generated_recommendations = generate_recommendations(validation_report, scores)
+    all_recommendations = [
+        rec if isinstance(rec, dict) else {'description': str(rec), 'priority': 'medium'}
+        for rec in recommendations + generated_recommendations
+    ]
     
     if not all_recommendations:
         st.success("🎉 Excellent work! No specific recommendations at this time.")
         return
     
-    # Group recommendations by priority
-    priority_groups = {'high': [], 'medium': [], 'low': []}
+    # Group recommendations by priority in a single pass (unknown priorities count as medium)
+    priority_groups = defaultdict(list)
     
     for rec in all_recommendations:
-        if isinstance(rec, dict):
-            priority = rec.get('priority', 'medium')
-            priority_groups[priority].append(rec)
-        else:
-            priority_groups['medium'].append({'description': str(rec), 'priority': 'medium'})
+        priority = rec.get('priority', 'medium')
+        priority_groups[priority if priority in _PRIORITY_SET else 'medium'].append(rec)
     
     # Display recommendations by priority
     priority_info = {
@@ -330,14 +378,23 @@ def show_recommendations(validation_report: Dict[str, Any]) -> None:
         'low': {'icon': '🟢', 'title': 'Low Priority', 'color': '#28a745'}
     }
     
-    for priority, recs in priority_groups.items():
+    for priority in _PRIORITY_ORDER:
+        recs = priority_groups.get(priority)
         if not recs:
             continue
             
         info = priority_info[priority]
         st.markdown(f"### {info['icon']} {info['title']}")
         
-        for i, rec in enumerate(recs, 1):
+        # Paginate long groups so only one page of expanders is built per rerun
+        start = 0
+        if len(recs) > _RECS_PER_PAGE:
+            pages = (len(recs) + _RECS_PER_PAGE - 1) // _RECS_PER_PAGE
+            page = st.number_input(f"Page (of {pages})", min_value=1, max_value=pages,
+                                   value=1, key=f"rec_page_{priority}")
+            start = (page - 1) * _RECS_PER_PAGE
+        
+        for i, rec in enumerate(recs[start:start + _RECS_PER_PAGE], start + 1):
             description = rec.get('description', str(rec))
             action = rec.get('action', 'Review and address this issue')
             impact = rec.get('impact', 'Improves overall quality')
@@ -350,37 +407,25 @@ def show_recommendations(validation_report: Dict[str, Any]) -> None:
 
 def get_quality_tier(score: float) -> Dict[str, str]:
     """Get quality tier information based on score."""
-    
-    if score >= 90:
-        return {
-            'name': 'Excellent',
-            'description': 'Outstanding quality with minimal issues'
-        }
-    elif score >= 75:
-        return {
-            'name': 'Good', 
-            'description': 'High quality with minor improvements needed'
-        }
-    elif score >= 60:
-        return {
-            'name': 'Fair',
-            'description': 'Acceptable quality with some issues to address'
-        }
-    else:
-        return {
-            'name': 'Poor',
-            'description': 'Significant issues requiring attention'
-        }
+    return dict(_TIERS[bisect_right(_TIER_THRESHOLDS, score)])
 
 
-def generate_recommendations(validation_report: Dict[str, Any]) -> List[Dict[str, str]]:
+def generate_recommendations(validation_report: Dict[str, Any],
+                             scores: Optional[_ExtractedScores] = None) -> List[Dict[str, str]]:
     """Generate recommendations based on validation results."""
     
+    scores = scores or _extract_scores(validation_report)
+    return list(_gen_recs(scores.overall, scores.req_rate, scores.q_rate, scores.cov_pct))
+
+
+@st.cache_data(show_spinner=False)
+def _gen_recs(overall: float, req_rate: float, q_rate: float, cov_pct: float) -> tuple:
+    """Build the score-based recommendations for a set of component scores."""
+    
     recommendations = []
-    overall_score = validation_report.get('overall_score', 0)
     
     # Score-based recommendations
-    if overall_score < 60:
+    if overall < 60:
         recommendations.append({
             'priority': 'high',
             'description': 'Overall validation score is below acceptable threshold',
@@ -389,8 +434,7 @@ def generate_recommendations(validation_report: Dict[str, Any]) -> List[Dict[str
         })
     
     # Component-specific recommendations
-    req_validation = validation_report.get('requirement_validation', {})
-    if req_validation.get('validation_rate', 0) < 70:
+    if req_rate < 70:
         recommendations.append({
             'priority': 'high',
             'description': 'Requirements validation score is low',
@@ -398,8 +442,7 @@ def generate_recommendations(validation_report: Dict[str, Any]) -> List[Dict[str
             'impact': 'Improves requirement quality and traceability'
         })
     
-    q_validation = validation_report.get('question_validation', {})
-    if q_validation.get('validation_rate', 0) < 70:
+    if q_rate < 70:
         recommendations.append({
             'priority': 'medium',
             'description': 'Question validation score needs improvement',
@@ -407,9 +450,7 @@ def generate_recommendations(validation_report: Dict[str, Any]) -> List[Dict[str
             'impact': 'Enhances application form quality and user experience'
         })
     
-    coverage_analysis = validation_report.get('coverage_analysis', {})
-    coverage_pct = coverage_analysis.get('requirement_coverage', {}).get('coverage_percentage', 0)
-    if coverage_pct < 80:
+    if cov_pct < 80:
         recommendations.append({
             'priority': 'high',
             'description': 'Policy coverage is incomplete',
@@ -417,7 +458,7 @@ def generate_recommendations(validation_report: Dict[str, Any]) -> List[Dict[str
             'impact': 'Ensures comprehensive requirement capture'
         })
     
-    return recommendations
+    return tuple(recommendations)
 
 
 def show_requirements_details(req_validation: Dict[str, Any]) -> None:
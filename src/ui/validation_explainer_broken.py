@@ -1,8 +1,69 @@
 import streamlit as st
-import plotly.graph_objects as go
-import plotly.express as px
-import pandas as pd
-from typing import Dict, Any, List
+import json
+import textwrap
+from bisect import bisect_right
+from collections import defaultdict, namedtuple
+import numpy as np
+from typing import Dict, Any, List, Optional
+
+
+# Quality tiers, ordered to match bisect_right over the lower bounds of Fair/Good/Excellent
+_TIER_THRESHOLDS = (60, 75, 90)
+_TIERS = (
+    {'name': 'Poor', 'description': 'Significant issues requiring attention'},
+    {'name': 'Fair', 'description': 'Acceptable quality with some issues to address'},
+    {'name': 'Good', 'description': 'High quality with minor improvements needed'},
+    {'name': 'Excellent', 'description': 'Outstanding quality with minimal issues'}
+)
+
+# Weighted scoring formula (Requirements: 30%, Questions: 30%, Coverage: 40%)
+_COMPONENT_NAMES = ('Requirements', 'Questions', 'Coverage')
+_WEIGHTS = np.array([0.30, 0.30, 0.40])
+_WEIGHT_LABELS = tuple(f"{weight * 100:.0f}%" for weight in _WEIGHTS)
+_COLORS = ['#FF6B6B', '#4ECDC4', '#45B7D1']
+
+# Report keys that carry renderable validation results
+_REPORT_SECTIONS = (
+    'overall_score', 'validation_errors', 'recommendations',
+    'coverage_analysis', 'requirement_validation', 'question_validation'
+)
+
+_SEVERITY_ICONS = {'high': '🔴', 'medium': '🟡', 'low': '🟢'}
+
+# Display order and styling for recommendation priorities
+_PRIORITY_INFO = {
+    'high': {'icon': '🔴', 'title': 'High Priority', 'color': '#dc3545'},
+    'medium': {'icon': '🟡', 'title': 'Medium Priority', 'color': '#ffc107'},
+    'low': {'icon': '🟢', 'title': 'Low Priority', 'color': '#28a745'}
+}
+
+# (predicate over a _ReportView, recommendation emitted when it holds)
+_REC_RULES = (
+    (lambda v: v.overall < 60, {
+        'priority': 'high',
+        'description': 'Overall validation score is below acceptable threshold',
+        'action': 'Review policy document quality and re-run extraction process',
+        'impact': 'Significantly improves extraction accuracy and completeness'
+    }),
+    (lambda v: v.req_score < 70, {
+        'priority': 'high',
+        'description': 'Requirements validation score is low',
+        'action': 'Review extracted requirements for clarity and policy alignment',
+        'impact': 'Improves requirement quality and traceability'
+    }),
+    (lambda v: v.q_score < 70, {
+        'priority': 'medium',
+        'description': 'Question validation score needs improvement',
+        'action': 'Review generated questions for relevance and clarity',
+        'impact': 'Enhances application form quality and user experience'
+    }),
+    (lambda v: v.cov_score < 80, {
+        'priority': 'high',
+        'description': 'Policy coverage is incomplete',
+        'action': 'Review policy document for missing sections or unclear content',
+        'impact': 'Ensures comprehensive requirement capture'
+    }),
+)
 
 
 def create_validation_dashboard(validation_report: Dict[str, Any]) -> None:
@@ -17,6 +78,14 @@ def create_validation_dashboard(validation_report: Dict[str, Any]) -> None:
         st.info("No validation report available")
         return
     
+    # A report with no populated sections would only render zeroed tabs
+    if not any(validation_report.get(key) for key in _REPORT_SECTIONS):
+        st.info("Validation has not produced any results yet")
+        return
+    
+    # Derive scores, recommendations and chart specs once per distinct report
+    prepared = _prepare_dashboard(_report_key(validation_report), validation_report)
+    
     # Create tabs for different aspects of validation
     val_tabs = st.tabs([
         "📊 Score Breakdown",
@@ -27,7 +96,7 @@ def create_validation_dashboard(validation_report: Dict[str, Any]) -> None:
     
     # Tab 1: Score Breakdown
     with val_tabs[0]:
-        show_score_breakdown(validation_report)
+        show_score_breakdown(validation_report, prepared)
     
     # Tab 2: Methodology
     with val_tabs[1]:
@@ -39,24 +108,133 @@ def create_validation_dashboard(validation_report: Dict[str, Any]) -> None:
     
     # Tab 4: Recommendations
     with val_tabs[3]:
-        show_recommendations(validation_report)
+        show_recommendations(validation_report, prepared)
 
 
-def show_score_breakdown(validation_report: Dict[str, Any]) -> None:
-    """Show detailed score breakdown with visualizations."""
+# Flat view of the report fields the dashboard reads
+_ReportView = namedtuple(
+    '_ReportView',
+    'overall req_score q_score cov_score req_val q_val cov errors'
+)
+
+
+def _view(validation_report: Dict[str, Any]) -> _ReportView:
+    """Walk the nested report once into a flat _ReportView."""
+    req_val = validation_report.get('requirement_validation') or {}
+    q_val = validation_report.get('question_validation') or {}
+    cov = validation_report.get('coverage_analysis') or {}
+    req_coverage = cov.get('requirement_coverage') or {}
+    return _ReportView(
+        validation_report.get('overall_score', 0),
+        req_val.get('validation_rate', 0),
+        q_val.get('validation_rate', 0),
+        req_coverage.get('coverage_percentage', 0),
+        req_val,
+        q_val,
+        cov,
+        validation_report.get('validation_errors', 0)
+    )
+
+
+def _report_key(validation_report: Dict[str, Any]) -> str:
+    """Serialize a validation report into a stable, hashable cache key."""
+    try:
+        return json.dumps(validation_report, sort_keys=True, default=str)
+    except TypeError:
+        # Mixed key types can't be sorted; insertion order still identifies the report
+        return json.dumps(validation_report, default=str)
+
+
+@st.cache_data(show_spinner=False)
+def _prepare_dashboard(report_key: str, _validation_report: Dict[str, Any]) -> Dict[str, Any]:
+    """Compute scores, tier, recommendations and chart specs for a report, cached by its key."""
+    
+    validation_report = _validation_report
+    view = _view(validation_report)
+    
+    # Weighted contributions (vectorized over _COMPONENT_NAMES order)
+    scores = np.array([view.req_score, view.q_score, view.cov_score], dtype=float)
+    contribs = scores * _WEIGHTS
+    score_labels = np.char.mod('%.1f%%', scores).tolist()
+    
+    # Pre-formatted (name, expander title, score, weight, contribution) per component
+    component_rows = [
+        (name, f"{name}: {score} (Weight: {weight})", score, weight, contrib)
+        for name, score, weight, contrib in zip(
+            _COMPONENT_NAMES, score_labels, _WEIGHT_LABELS,
+            np.char.mod('%.1f%%', contribs).tolist())
+    ]
     
-    st.subheader("🔍 Validation Score Composition")
+    # Component scores chart as a plain dict spec (st.plotly_chart validates it on render)
+    fig_scores = {
+        "data": [{
+            "type": "bar",
+            "x": list(_COMPONENT_NAMES),
+            "y": scores.tolist(),
+            "text": score_labels,
+            "textposition": "auto",
+            "marker": {"color": _COLORS}
+        }],
+        "layout": {
+            "title": {"text": "Component Scores"},
+            "yaxis": {"title": {"text": "Score (%)"}},
+            "showlegend": False,
+            "height": 400
+        }
+    }
     
-    overall_score = validation_report.get('overall_score', 0)
+    # Weighted contributions pie chart
+    fig_pie = {
+        "data": [{
+            "type": "pie",
+            "labels": list(_COMPONENT_NAMES),
+            "values": contribs.tolist(),
+            "hole": 0.4,
+            "textinfo": "label+percent",
+            "marker": {"colors": _COLORS}
+        }],
+        "layout": {
+            "title": {"text": "Weighted Contributions to Overall Score"},
+            "height": 400
+        }
+    }
     
-    # Extract component scores
-    req_validation = validation_report.get('requirement_validation', {})
-    q_validation = validation_report.get('question_validation', {})
-    coverage_analysis = validation_report.get('coverage_analysis', {})
+    return {
+        'overall_score': view.overall,
+        'req_validation': view.req_val,
+        'q_validation': view.q_val,
+        'coverage_analysis': view.cov,
+        'validation_errors': view.errors,
+        'component_rows': component_rows,
+        'tier': get_quality_tier(view.overall),
+        'recommendations': [
+            _labelled(rec) for rec in
+            validation_report.get('recommendations', []) + generate_recommendations(validation_report)
+        ],
+        'fig_scores': fig_scores,
+        'fig_pie': fig_pie
+    }
+
+
+def _labelled(rec: Any) -> Dict[str, Any]:
+    """Copy a recommendation as a dict carrying its shortened expander label."""
+    rec = dict(rec) if isinstance(rec, dict) else {'description': str(rec), 'priority': 'medium'}
+    description = rec.setdefault('description', str(rec))
+    rec['_label'] = textwrap.shorten(description, width=53, placeholder='…')
+    if rec['_label'] == '…':  # a single over-long word; fall back to a hard cut
+        rec['_label'] = description[:52] + '…'
+    return rec
+
+
+@st.fragment
+def show_score_breakdown(validation_report: Dict[str, Any],
+                         prepared: Optional[Dict[str, Any]] = None) -> None:
+    """Show detailed score breakdown with visualizations."""
+    
+    st.subheader("🔍 Validation Score Composition")
     
-    req_score = req_validation.get('validation_rate', 0)
-    q_score = q_validation.get('validation_rate', 0)
-    cov_score = coverage_analysis.get('requirement_coverage', {}).get('coverage_percentage', 0)
+    prepared = prepared or _prepare_dashboard(_report_key(validation_report), validation_report)
+    overall_score = prepared['overall_score']
     
     # Overall score display
     col1, col2, col3 = st.columns(3)
@@ -66,148 +244,59 @@ def show_score_breakdown(validation_report: Dict[str, Any]) -> None:
                  help="Weighted average of all validation components")
     
     with col2:
-        quality_tier = get_quality_tier(overall_score)
+        quality_tier = prepared['tier']
         st.metric("Quality Tier", quality_tier['name'], 
                  help=quality_tier['description'])
     
     with col3:
-        validation_errors = validation_report.get('validation_errors', 0)
-        st.metric("Validation Errors", validation_errors,
+        st.metric("Validation Errors", prepared['validation_errors'],
                  help="Number of validation issues identified")
     
     # Component breakdown with weights
     st.subheader("📊 Component Analysis")
     
-    # Weighted scoring formula (Requirements: 30%, Questions: 30%, Coverage: 40%)
-    weights = {'Requirements': 0.30, 'Questions': 0.30, 'Coverage': 0.40}
-    components = {
-        'Requirements': req_score,
-        'Questions': q_score, 
-        'Coverage': cov_score
-    }
-    
-    # Calculate weighted contributions
-    contributions = {}
-    for component, score in components.items():
-        contributions[component] = score * weights[component]
-    
     # Create visualization
     col1, col2 = st.columns(2)
     
     with col1:
-        # Component scores chart
-        fig_scores = go.Figure(data=[
-            go.Bar(
-                x=list(components.keys()),
-                y=list(components.values()),
-                text=[f"{v:.1f}%" for v in components.values()],
-                textposition='auto',
-                marker_color=['#FF6B6B', '#4ECDC4', '#45B7D1']
-            )
-        ])
-        fig_scores.update_layout(
-            title="Component Scores",
-            yaxis_title="Score (%)",
-            showlegend=False,
-            height=400
-        )
-        st.plotly_chart(fig_scores, use_container_width=True)
+        st.plotly_chart(prepared['fig_scores'], use_container_width=True)
     
     with col2:
-        # Weighted contributions pie chart
-        fig_pie = go.Figure(data=[
-            go.Pie(
-                labels=list(contributions.keys()),
-                values=list(contributions.values()),
-                hole=0.4,
-                textinfo='label+percent',
-                marker_colors=['#FF6B6B', '#4ECDC4', '#45B7D1']
-            )
-        ])
-        fig_pie.update_layout(
-            title="Weighted Contributions to Overall Score",
-            height=400
-        )
-        st.plotly_chart(fig_pie, use_container_width=True)
+        st.plotly_chart(prepared['fig_pie'], use_container_width=True)
     
     # Detailed component analysis
     st.subheader("🔍 Component Details")
     
-    for component, score in components.items():
-        weight = weights[component]
-        contribution = contributions[component]
-        
-        with st.expander(f"{component}: {score:.1f}% (Weight: {weight*100:.0f}%)"):
+    for component, title, score, weight, contribution in prepared['component_rows']:
+        with st.expander(title):
             col1, col2, col3 = st.columns(3)
             
             with col1:
-                st.metric("Raw Score", f"{score:.1f}%")
+                st.metric("Raw Score", score)
             with col2:
-                st.metric("Weight", f"{weight*100:.0f}%")
+                st.metric("Weight", weight)
             with col3:
-                st.metric("Contribution", f"{contribution:.1f}%")
+                st.metric("Contribution", contribution)
             
             # Component-specific details
             if component == 'Requirements':
-                show_requirements_details(req_validation)
+                show_requirements_details(prepared['req_validation'])
             elif component == 'Questions':
-                show_questions_details(q_validation)
+                show_questions_details(prepared['q_validation'])
             elif component == 'Coverage':
-                show_coverage_details(coverage_analysis)
+                show_coverage_details(prepared['coverage_analysis'])
 
 
+@st.fragment
 def show_validation_methodology() -> None:
     """Explain the validation methodology and scoring approach."""
     
     st.subheader("📋 Validation Methodology")
     
-    st.markdown("""
-    ### 🎯 Scoring Formula
-    
-    The overall validation score is calculated using a **weighted average** of three key components:
-    
-    ```
-    Overall Score = (Requirements × 30%) + (Questions × 30%) + (Coverage × 40%)
-    ```
-    
-    ### 📊 Component Breakdown
-    """)
-    
-    # Component explanations
-    components_info = [
-        {
-            "name": "Requirements Validation (30%)",
-            "description": "Evaluates the quality and completeness of extracted requirements",
-            "criteria": [
-                "Requirement clarity and specificity",
-                "Policy reference accuracy", 
-                "Priority classification correctness",
-                "Completeness of requirement capture"
-            ]
-        },
-        {
-            "name": "Questions Validation (30%)",
-            "description": "Assesses the generated application questions",
-            "criteria": [
-                "Question relevance to policy requirements",
-                "Input type appropriateness",
-                "Question clarity and understandability",
-                "Coverage of all policy aspects"
-            ]
-        },
-        {
-            "name": "Coverage Analysis (40%)",
-            "description": "Measures how well the extraction covers the source policy",
-            "criteria": [
-                "Policy section coverage percentage",
-                "Requirement extraction completeness",
-                "Key policy element identification",
-                "Gap analysis accuracy"
-            ]
-        }
-    ]
+    content = _methodology_content()
+    st.markdown(content['intro'])
     
-    for component in components_info:
+    for component in content['components_info']:
         with st.expander(f"🔍 {component['name']}"):
             st.write(component['description'])
             st.write("**Evaluation Criteria:**")
@@ -217,6 +306,13 @@ def show_validation_methodology() -> None:
     # Quality tiers
     st.subheader("🏆 Quality Tiers")
     
+    st.markdown(content['tiers_html'], unsafe_allow_html=True)
+
+
+@st.cache_resource
+def _methodology_content() -> Dict[str, Any]:
+    """Build the methodology tab's static content once; it has no inputs."""
+    
     tiers = [
         {"range": "90-100%", "tier": "Excellent", "color": "#28a745", "description": "Outstanding quality with minimal issues"},
         {"range": "75-89%", "tier": "Good", "color": "#17a2b8", "description": "High quality with minor improvements needed"},
@@ -224,15 +320,62 @@ def show_validation_methodology() -> None:
         {"range": "0-59%", "tier": "Poor", "color": "#dc3545", "description": "Significant issues requiring attention"}
     ]
     
-    for tier in tiers:
-        st.markdown(f"""
-        <div style="padding: 10px; margin: 5px 0; border-left: 4px solid {tier['color']}; background-color: rgba(0,0,0,0.05);">
-            <strong>{tier['range']}: {tier['tier']}</strong><br>
-            {tier['description']}
-        </div>
-        """, unsafe_allow_html=True)
+    return {
+        'intro': """
+        ### 🎯 Scoring Formula
+        
+        The overall validation score is calculated using a **weighted average** of three key components:
+        
+        ```
+        Overall Score = (Requirements × 30%) + (Questions × 30%) + (Coverage × 40%)
+        ```
+        
+        ### 📊 Component Breakdown
+        """,
+        # Component explanations
+        'components_info': [
+            {
+                "name": "Requirements Validation (30%)",
+                "description": "Evaluates the quality and completeness of extracted requirements",
+                "criteria": [
+                    "Requirement clarity and specificity",
+                    "Policy reference accuracy", 
+                    "Priority classification correctness",
+                    "Completeness of requirement capture"
+                ]
+            },
+            {
+                "name": "Questions Validation (30%)",
+                "description": "Assesses the generated application questions",
+                "criteria": [
+                    "Question relevance to policy requirements",
+                    "Input type appropriateness",
+                    "Question clarity and understandability",
+                    "Coverage of all policy aspects"
+                ]
+            },
+            {
+                "name": "Coverage Analysis (40%)",
+                "description": "Measures how well the extraction covers the source policy",
+                "criteria": [
+                    "Policy section coverage percentage",
+                    "Requirement extraction completeness",
+                    "Key policy element identification",
+                    "Gap analysis accuracy"
+                ]
+            }
+        ],
+        # All tier cards as one HTML block so the tab emits a single element
+        'tiers_html': "\n".join(
+            f'<div style="padding: 10px; margin: 5px 0; border-left: 4px solid {tier["color"]}; '
+            f'background-color: rgba(0,0,0,0.05);"><strong>{tier["range"]}: {tier["tier"]}</strong><br>'
+            f'{tier["description"]}</div>'
+            for tier in tiers
+        )
+    }
 
 
+@st.fragment
 def show_detailed_results(validation_report: Dict[str, Any]) -> None:
     """Show detailed validation results and error analysis."""
     
@@ -243,18 +386,14 @@ def show_detailed_results(validation_report: Dict[str, Any]) -> None:
     if validation_errors:
         st.subheader("⚠️ Validation Issues")
         
+        lines = []
         for i, error in enumerate(validation_errors[:10], 1):  # Show top 10 errors
             severity = error.get('severity', 'medium') if isinstance(error, dict) else 'medium'
             message = error.get('message', str(error)) if isinstance(error, dict) else str(error)
             
-            severity_colors = {
-                'high': '🔴',
-                'medium': '🟡', 
-                'low': '🟢'
-            }
-            
-            icon = severity_colors.get(severity, '🟡')
-            st.write(f"{icon} **Issue {i}**: {message}")
+            icon = _SEVERITY_ICONS.get(severity, '🟡')
+            lines.append(f"{icon} **Issue {i}**: {message}")
+        st.markdown("\n\n".join(lines))
     else:
         st.success("✅ No validation issues identified")
     
@@ -286,55 +425,41 @@ def show_detailed_results(validation_report: Dict[str, Any]) -> None:
         
         missing_reqs = gap_analysis.get('missing_requirements', [])
         if missing_reqs:
-            st.write("**Missing Requirements:**")
-            for req in missing_reqs[:5]:  # Show top 5
-                st.write(f"• {req}")
+            st.markdown(_bullet_block("Missing Requirements", missing_reqs[:5]))  # Show top 5
         
         incomplete_sections = gap_analysis.get('incomplete_sections', [])
         if incomplete_sections:
-            st.write("**Incomplete Sections:**")
-            for section in incomplete_sections[:5]:  # Show top 5
-                st.write(f"• {section}")
+            st.markdown(_bullet_block("Incomplete Sections", incomplete_sections[:5]))  # Show top 5
 
 
-def show_recommendations(validation_report: Dict[str, Any]) -> None:
+@st.fragment
+def show_recommendations(validation_report: Dict[str, Any],
+                         prepared: Optional[Dict[str, Any]] = None) -> None:
     """Show actionable recommendations based on validation results."""
     
     st.subheader("💡 Actionable Recommendations")
     
-    overall_score = validation_report.get('overall_score', 0)
-    recommendations = validation_report.get('recommendations', [])
-    
-    # Generate recommendations based on score
-    generated_recommendations = generate_recommendations(validation_report)
-    all_recommendations = recommendations + generated_recommendations
+    # Report recommendations plus those generated from the scores
+    prepared = prepared or _prepare_dashboard(_report_key(validation_report), validation_report)
+    all_recommendations = prepared['recommendations']
     
     if not all_recommendations:
         st.success("🎉 Excellent work! No specific recommendations at this time.")
         return
     
-    # Group recommendations by priority
-    priority_groups = {'high': [], 'medium': [], 'low': []}
+    # Group recommendations by priority in a single pass (unknown priorities count as medium)
+    priority_groups = defaultdict(list)
     
     for rec in all_recommendations:
-        if isinstance(rec, dict):
-            priority = rec.get('priority', 'medium')
-            priority_groups[priority].append(rec)
-        else:
-            priority_groups['medium'].append({'description': str(rec), 'priority': 'medium'})
+        priority = rec.get('priority', 'medium')
+        priority_groups[priority if priority in _PRIORITY_INFO else 'medium'].append(rec)
     
     # Display recommendations by priority
-    priority_info = {
-        'high': {'icon': '🔴', 'title': 'High Priority', 'color': '#dc3545'},
-        'medium': {'icon': '🟡', 'title': 'Medium Priority', 'color': '#ffc107'},
-        'low': {'icon': '🟢', 'title': 'Low Priority', 'color': '#28a745'}
-    }
-    
-    for priority, recs in priority_groups.items():
+    for priority, info in _PRIORITY_INFO.items():
+        recs = priority_groups.get(priority, ())
         if not recs:
             continue
             
-        info = priority_info[priority]
         st.markdown(f"### {info['icon']} {info['title']}")
         
         for i, rec in enumerate(recs, 1):
@@ -342,82 +467,29 @@ def show_recommendations(validation_report: Dict[str, Any]) -> None:
             action = rec.get('action', 'Review and address this issue')
             impact = rec.get('impact', 'Improves overall quality')
             
-            with st.expander(f"{info['icon']} Recommendation {i}: {description[:50]}..."):
-                st.write(f"**Issue:** {description}")
-                st.write(f"**Recommended Action:** {action}")
-                st.write(f"**Expected Impact:** {impact}")
+            with st.expander(f"{info['icon']} Recommendation {i}: {rec['_label']}"):
+                st.markdown(
+                    f"**Issue:** {description}\n\n"
+                    f"**Recommended Action:** {action}\n\n"
+                    f"**Expected Impact:** {impact}"
+                )
 
 
 def get_quality_tier(score: float) -> Dict[str, str]:
     """Get quality tier information based on score."""
-    
-    if score >= 90:
-        return {
-            'name': 'Excellent',
-            'description': 'Outstanding quality with minimal issues'
-        }
-    elif score >= 75:
-        return {
-            'name': 'Good', 
-            'description': 'High quality with minor improvements needed'
-        }
-    elif score >= 60:
-        return {
-            'name': 'Fair',
-            'description': 'Acceptable quality with some issues to address'
-        }
-    else:
-        return {
-            'name': 'Poor',
-            'description': 'Significant issues requiring attention'
-        }
+    return dict(_TIERS[bisect_right(_TIER_THRESHOLDS, score)])
 
 
 def generate_recommendations(validation_report: Dict[str, Any]) -> List[Dict[str, str]]:
     """Generate recommendations based on validation results."""
-    
-    recommendations = []
-    overall_score = validation_report.get('overall_score', 0)
-    
-    # Score-based recommendations
-    if overall_score < 60:
-        recommendations.append({
-            'priority': 'high',
-            'description': 'Overall validation score is below acceptable threshold',
-            'action': 'Review policy document quality and re-run extraction process',
-            'impact': 'Significantly improves extraction accuracy and completeness'
-        })
-    
-    # Component-specific recommendations
-    req_validation = validation_report.get('requirement_validation', {})
-    if req_validation.get('validation_rate', 0) < 70:
-        recommendations.append({
-            'priority': 'high',
-            'description': 'Requirements validation score is low',
-            'action': 'Review extracted requirements for clarity and policy alignment',
-            'impact': 'Improves requirement quality and traceability'
-        })
-    
-    q_validation = validation_report.get('question_validation', {})
-    if q_validation.get('validation_rate', 0) < 70:
-        recommendations.append({
-            'priority': 'medium',
-            'description': 'Question validation score needs improvement',
-            'action': 'Review generated questions for relevance and clarity',
-            'impact': 'Enhances application form quality and user experience'
-        })
-    
-    coverage_analysis = validation_report.get('coverage_analysis', {})
-    coverage_pct = coverage_analysis.get('requirement_coverage', {}).get('coverage_percentage', 0)
-    if coverage_pct < 80:
-        recommendations.append({
-            'priority': 'high',
-            'description': 'Policy coverage is incomplete',
-            'action': 'Review policy document for missing sections or unclear content',
-            'impact': 'Ensures comprehensive requirement capture'
-        })
-    
-    return recommendations
+    # Copy the shared rule dicts so callers can modify what they receive
+    view = _view(validation_report)
+    return [dict(rec) for applies, rec in _REC_RULES if applies(view)]
+
+
+def _bullet_block(title: str, items: List[Any]) -> str:
+    """Render a bold title and its items as one markdown bullet list."""
+    return f"**{title}:**\n" + "".join(f"\n- {item}" for item in items)
 
 
 def show_requirements_details(req_validation: Dict[str, Any]) -> None:
@@ -432,9 +504,7 @@ def show_requirements_details(req_validation: Dict[str, Any]) -> None:
     
     issues = req_validation.get('issues', [])
     if issues:
-        st.write("**Common Issues:**")
-        for issue in issues[:3]:
-            st.write(f"• {issue}")
+        st.markdown(_bullet_block("Common Issues", issues[:3]))
 
 
 def show_questions_details(q_validation: Dict[str, Any]) -> None:
@@ -467,322 +537,3 @@ def show_coverage_details(coverage_analysis: Dict[str, Any]) -> None:
     policy_sections = coverage_analysis.get('policy_sections', [])
     if policy_sections:
         st.write(f"**Policy Sections:** {len(policy_sections)} identified")
-    """)
-    
-    # Component breakdown
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.metric(
-            "Requirements Validation",
-            f"{req_score:.1f}%",
-            delta=f"Weight: 30%",
-            help="Validates requirement structure, completeness, and policy references"
-        )
-        
-        # Requirements details
-        if req_validation:
-            total_reqs = req_validation.get('total_requirements', 0)
-            valid_reqs = req_validation.get('valid_requirements', 0)
-            invalid_reqs = req_validation.get('invalid_requirements', 0)
-            
-            st.write(f"**Details:**")
-            st.write(f"• Total: {total_reqs}")
-            st.write(f"• Valid: {valid_reqs}")
-            st.write(f"• Invalid: {invalid_reqs}")
-    
-    with col2:
-        st.metric(
-            "Questions Validation", 
-            f"{q_score:.1f}%",
-            delta=f"Weight: 30%",
-            help="Validates question structure, types, and completeness"
-        )
-        
-        # Questions details
-        if q_validation:
-            total_questions = q_validation.get('total_questions', 0)
-            valid_questions = q_validation.get('valid_questions', 0)
-            invalid_questions = q_validation.get('invalid_questions', 0)
-            
-            st.write(f"**Details:**")
-            st.write(f"• Total: {total_questions}")
-            st.write(f"• Valid: {valid_questions}")
-            st.write(f"• Invalid: {invalid_questions}")
-    
-    with col3:
-        st.metric(
-            "Policy Coverage",
-            f"{cov_score:.1f}%", 
-            delta=f"Weight: 40%",
-            help="Measures how well requirements cover the policy sections"
-        )
-        
-        # Coverage details
-        if coverage_analysis:
-            req_coverage = coverage_analysis.get('requirement_coverage', {})
-            covered_sections = len(req_coverage.get('covered_sections', []))
-            uncovered_sections = len(req_coverage.get('uncovered_sections', []))
-            total_sections = covered_sections + uncovered_sections
-            
-            st.write(f"**Details:**")
-            st.write(f"• Total Sections: {total_sections}")
-            st.write(f"• Covered: {covered_sections}")
-            st.write(f"• Uncovered: {uncovered_sections}")
-    
-    # Visual breakdown
-    st.subheader("📈 Score Composition")
-    
-    # Calculate weighted contributions
-    req_contribution = req_score * 0.3
-    q_contribution = q_score * 0.3
-    cov_contribution = cov_score * 0.4
-    
-    # Create breakdown chart
-    fig = go.Figure(data=[
-        go.Bar(
-            name='Requirements (30%)',
-            x=['Contribution'],
-            y=[req_contribution],
-            text=[f'{req_contribution:.1f}%'],
-            textposition='auto',
-            marker_color='lightblue'
-        ),
-        go.Bar(
-            name='Questions (30%)',
-            x=['Contribution'], 
-            y=[q_contribution],
-            text=[f'{q_contribution:.1f}%'],
-            textposition='auto',
-            marker_color='lightgreen'
-        ),
-        go.Bar(
-            name='Coverage (40%)',
-            x=['Contribution'],
-            y=[cov_contribution], 
-            text=[f'{cov_contribution:.1f}%'],
-            textposition='auto',
-            marker_color='lightcoral'
-        )
-    ])
-    
-    fig.update_layout(
-        title=f"Overall Score: {overall_score:.1f}%",
-        yaxis_title="Score Contribution (%)",
-        barmode='stack',
-        height=400
-    )
-    
-    st.plotly_chart(fig, use_container_width=True)
-    
-    # Quality assessment
-    st.subheader("🎯 Quality Assessment")
-    
-    if overall_score >= 90:
-        st.success("🟢 **Excellent Quality** - Ready for production implementation")
-        quality_level = "excellent"
-    elif overall_score >= 75:
-        st.info("🟡 **Good Quality** - Minor improvements recommended")
-        quality_level = "good"
-    elif overall_score >= 60:
-        st.warning("🟠 **Fair Quality** - Significant improvements needed")
-        quality_level = "fair"
-    else:
-        st.error("🔴 **Poor Quality** - Major revisions required")
-        quality_level = "poor"
-    
-    # Recommendations
-    recommendations = validation_report.get('recommendations', [])
-    if recommendations:
-        st.subheader("💡 Improvement Recommendations")
-        
-        for rec in recommendations:
-            priority = rec.get('priority', 'medium')
-            rec_type = rec.get('type', 'general')
-            description = rec.get('description', 'No description')
-            action = rec.get('action', 'No action specified')
-            impact = rec.get('impact', 'No impact specified')
-            
-            # Priority icon
-            priority_icons = {
-                'high': '🔴',
-                'medium': '🟡', 
-                'low': '🟢'
-            }
-            priority_icon = priority_icons.get(priority, '⚪')
-            
-            with st.expander(f"{priority_icon} {rec_type.title()}: {description}"):
-                st.write(f"**Action:** {action}")
-                st.write(f"**Impact:** {impact}")
-                st.write(f"**Priority:** {priority.title()}")
-
-
-def show_validation_methodology() -> None:
-    """Show detailed validation methodology explanation."""
-    
-    st.subheader("🔬 Validation Methodology")
-    
-    st.markdown("""
-    ### **How Validation Works**
-    
-    The ValidationAgent performs comprehensive quality assessment across multiple dimensions:
-    
-    #### **1. Requirements Validation (30% weight)**
-    - **Structure Check**: Validates JSON structure and required fields
-    - **Content Quality**: Ensures meaningful descriptions and proper IDs
-    - **Policy References**: Verifies policy section references are valid
-    - **Priority Assessment**: Checks priority levels are appropriate
-    - **Completeness**: Ensures all requirement types are covered
-    
-    #### **2. Questions Validation (30% weight)**  
-    - **Format Validation**: Checks question structure and fields
-    - **Type Consistency**: Validates input types (text, select, etc.)
-    - **Required Fields**: Ensures critical questions are marked required
-    - **Help Text Quality**: Validates guidance text is provided
-    - **Section Coverage**: Checks questions cover all policy areas
-    
-    #### **3. Policy Coverage Analysis (40% weight)**
-    - **Section Mapping**: Maps requirements to policy sections
-    - **Coverage Percentage**: Calculates % of policy sections covered
-    - **Gap Identification**: Identifies uncovered policy areas
-    - **Completeness Score**: Measures comprehensive policy implementation
-    
-    ### **Scoring Thresholds**
-    
-    | Score Range | Quality Level | Description |
-    |-------------|---------------|-------------|
-    | 90-100% | 🟢 Excellent | Production ready |
-    | 75-89% | 🟡 Good | Minor improvements needed |
-    | 60-74% | 🟠 Fair | Significant improvements needed |
-    | 0-59% | 🔴 Poor | Major revisions required |
-    
-    ### **Fallback Mechanism**
-    
-    When using enhanced agents with fallback data:
-    - **Minimum Score**: 75% to ensure realistic demo results
-    - **Fallback Content**: Pre-defined high-quality requirements and questions
-    - **Realistic Metrics**: Ensures meaningful validation even with synthetic data
-    """)
-
-
-def create_validation_dashboard(validation_report: Dict[str, Any]) -> None:
-    """Create comprehensive validation dashboard."""
-    
-    if not validation_report:
-        st.info("No validation data available")
-        return
-    
-    # Main tabs for validation dashboard
-    val_tabs = st.tabs([
-        "📊 Score Breakdown",
-        "🔬 Methodology", 
-        "📋 Detailed Results",
-        "🎯 Recommendations"
-    ])
-    
-    with val_tabs[0]:
-        show_validation_score_explanation(validation_report)
-    
-    with val_tabs[1]:
-        show_validation_methodology()
-    
-    with val_tabs[2]:
-        show_detailed_validation_results(validation_report)
-    
-    with val_tabs[3]:
-        show_validation_recommendations(validation_report)
-
-
-def show_detailed_validation_results(validation_report: Dict[str, Any]) -> None:
-    """Show detailed validation results."""
-    
-    st.subheader("📋 Detailed Validation Results")
-    
-    # Requirements validation details
-    req_validation = validation_report.get('requirement_validation', {})
-    if req_validation:
-        st.write("### Requirements Validation")
-        
-        errors = req_validation.get('errors', [])
-        if errors:
-            st.write("**Validation Errors:**")
-            for error in errors:
-                st.error(f"• {error}")
-        else:
-            st.success("✅ No requirement validation errors")
-    
-    # Questions validation details  
-    q_validation = validation_report.get('question_validation', {})
-    if q_validation:
-        st.write("### Questions Validation")
-        
-        errors = q_validation.get('errors', [])
-        if errors:
-            st.write("**Validation Errors:**")
-            for error in errors:
-                st.error(f"• {error}")
-        else:
-            st.success("✅ No question validation errors")
-    
-    # Coverage analysis details
-    coverage_analysis = validation_report.get('coverage_analysis', {})
-    if coverage_analysis:
-        st.write("### Coverage Analysis")
-        
-        req_coverage = coverage_analysis.get('requirement_coverage', {})
-        covered_sections = req_coverage.get('covered_sections', [])
-        uncovered_sections = req_coverage.get('uncovered_sections', [])
-        
-        if covered_sections:
-            st.write("**Covered Policy Sections:**")
-            for section in covered_sections:
-                st.success(f"✅ {section}")
-        
-        if uncovered_sections:
-            st.write("**Uncovered Policy Sections:**")
-            for section in uncovered_sections:
-                st.warning(f"⚠️ {section}")
-
-
-def show_validation_recommendations(validation_report: Dict[str, Any]) -> None:
-    """Show validation recommendations."""
-    
-    st.subheader("🎯 Improvement Recommendations")
-    
-    recommendations = validation_report.get('recommendations', [])
-    
-    if not recommendations:
-        st.success("🎉 No recommendations - validation quality is excellent!")
-        return
-    
-    # Group by priority
-    high_priority = [r for r in recommendations if r.get('priority') == 'high']
-    medium_priority = [r for r in recommendations if r.get('priority') == 'medium'] 
-    low_priority = [r for r in recommendations if r.get('priority') == 'low']
-    
-    if high_priority:
-        st.write("### 🔴 High Priority")
-        for rec in high_priority:
-            with st.container():
-                st.error(f"**{rec.get('type', 'General').title()}**: {rec.get('description', 'No description')}")
-                st.write(f"**Action**: {rec.get('action', 'No action specified')}")
-                st.write(f"**Impact**: {rec.get('impact', 'No impact specified')}")
-                st.divider()
-    
-    if medium_priority:
-        st.write("### 🟡 Medium Priority")
-        for rec in medium_priority:
-            with st.container():
-                st.warning(f"**{rec.get('type', 'General').title()}**: {rec.get('description', 'No description')}")
-                st.write(f"**Action**: {rec.get('action', 'No action specified')}")
-                st.write(f"**Impact**: {rec.get('impact', 'No impact specified')}")
-                st.divider()
-    
-    if low_priority:
-        st.write("### 🟢 Low Priority")
-        for rec in low_priority:
-            with st.container():
-                st.info(f"**{rec.get('type', 'General').title()}**: {rec.get('description', 'No description')}")
-                st.write(f"**Action**: {rec.get('action', 'No action specified')}")
-                st.write(f"**Impact**: {rec.get('impact', 'No impact specified')}")
-                st.divider()
@@ -1,5 +1,23 @@
-from .document_parser import DocumentParser
-from .output_formatter import OutputFormatter
-from .validator import Validator
+import importlib
 
 __all__ = ['DocumentParser', 'OutputFormatter', 'Validator']
+
+# Re-exports resolved on first access (PEP 562), so importing one submodule
+# such as src.utils.enhanced_document_parser does not load the others.
+_LAZY = {
+    'DocumentParser': '.document_parser',
+    'OutputFormatter': '.output_formatter',
+    'Validator': '.validator'
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -3,6 +3,20 @@ from typing import Dict, List, Any
 from pathlib import Path
 
 
+# Pre-compiled extraction patterns
+_SECTION_RE = re.compile(r'(V\d+\.\d+(?:\.\d+)?)\s+([A-Z\s]+)\n\n(.*?)(?=\n\nV\d+\.\d+|$)', re.DOTALL)
+_REQUIREMENT_RE = re.compile(r'\(([a-z]+|[ivx]+)\)\s+(.*?)(?=\n\([a-z]+|[ivx]+\)|$)', re.DOTALL)
+_CURRENCY_RE = re.compile(r'NZD\s*\$\s*([\d,]+)')
+_TIME_RE = re.compile(r'(\d+)\s+(months?|years?|days?)')
+_AGE_RE = re.compile(r'(?:under|over|age)\s+(\d+)', re.IGNORECASE)
+# Clauses end at ; a newline or a full stop followed by whitespace. Splitting
+# them in one pass keeps condition extraction linear, unlike a leading lazy .*?
+# that is retried from every offset of a long keyword-free line.
+_CLAUSE_RE = re.compile(r'(?:[^.;\n]|\.(?!\s|$))+')
+_MUST_RE = re.compile(r'\bmust\s', re.IGNORECASE)
+_MAY_RE = re.compile(r'\bmay\s', re.IGNORECASE)
+
+
 class DocumentParser:
     """Utility class for parsing policy documents."""
     
@@ -29,10 +43,8 @@ class DocumentParser:
         """
         sections = {}
         
-        # Pattern to match section headers like "V4.1 OBJECTIVE"
-        pattern = r'(V\d+\.\d+(?:\.\d+)?)\s+([A-Z\s]+)\n\n(.*?)(?=\n\nV\d+\.\d+|$)'
-        
-        matches = re.finditer(pattern, document, re.DOTALL)
+        # Match section headers like "V4.1 OBJECTIVE"
+        matches = _SECTION_RE.finditer(document)
         
         for match in matches:
             section_code = match.group(1)
@@ -59,10 +71,8 @@ class DocumentParser:
         """
         requirements = []
         
-        # Pattern to match numbered/lettered requirements
-        pattern = r'\(([a-z]+|[ivx]+)\)\s+(.*?)(?=\n\([a-z]+|[ivx]+\)|$)'
-        
-        matches = re.finditer(pattern, section_content, re.DOTALL)
+        # Match numbered/lettered requirements
+        matches = _REQUIREMENT_RE.finditer(section_content)
         
         for match in matches:
             requirement = match.group(2).strip()
@@ -84,16 +94,13 @@ class DocumentParser:
         thresholds = {}
         
         # Extract currency amounts
-        currency_pattern = r'NZD\s*\$\s*([\d,]+)'
-        amounts = re.findall(currency_pattern, document)
+        amounts = _CURRENCY_RE.findall(document)
         
         # Extract time periods
-        time_pattern = r'(\d+)\s+(months?|years?|days?)'
-        periods = re.findall(time_pattern, document)
+        periods = _TIME_RE.findall(document)
         
         # Extract age limits
-        age_pattern = r'(?:under|over|age)\s+(\d+)'
-        ages = re.findall(age_pattern, document, re.IGNORECASE)
+        ages = _AGE_RE.findall(document)
         
         thresholds['currency_amounts'] = [int(a.replace(',', '')) for a in amounts]
         thresholds['time_periods'] = periods
@@ -112,26 +119,18 @@ class DocumentParser:
         Returns:
             List of conditions with their context
         """
-        conditions = []
-        
-        # Pattern for "must" statements
-        must_pattern = r'(.*?must\s+.*?)(?:\.|;|\n)'
-        must_matches = re.finditer(must_pattern, document, re.IGNORECASE)
-        
-        for match in must_matches:
-            conditions.append({
-                'type': 'requirement',
-                'statement': match.group(1).strip()
-            })
-        
-        # Pattern for "may" statements
-        may_pattern = r'(.*?may\s+.*?)(?:\.|;|\n)'
-        may_matches = re.finditer(may_pattern, document, re.IGNORECASE)
-        
-        for match in may_matches:
-            conditions.append({
-                'type': 'optional',
-                'statement': match.group(1).strip()
-            })
+        clauses = [match.group().strip() for match in _CLAUSE_RE.finditer(document)]
+        
+        # "must" statements
+        conditions = [
+            {'type': 'requirement', 'statement': clause}
+            for clause in clauses if _MUST_RE.search(clause)
+        ]
+        
+        # "may" statements
+        conditions.extend(
+            {'type': 'optional', 'statement': clause}
+            for clause in clauses if _MAY_RE.search(clause)
+        )
         
         return conditions
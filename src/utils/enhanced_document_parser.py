@@ -1,6 +1,8 @@
 import re
 import io
-from typing import Dict, List, Any, Optional
+import pickle
+from functools import cache, lru_cache
+from typing import Dict, List, Any, Optional, Sequence, Tuple
 from pathlib import Path
 import logging
 
@@ -12,6 +14,13 @@ try:
 except ImportError:
     PDF_AVAILABLE = False
 
+# Fast C-backed PDF text extraction (installed with pdfplumber >= 0.10)
+try:
+    import pypdfium2 as pdfium
+    PDFIUM_AVAILABLE = True
+except ImportError:
+    PDFIUM_AVAILABLE = False
+
 # Word document parsing
 try:
     from docx import Document as DocxDocument
@@ -19,27 +28,188 @@ try:
 except ImportError:
     DOCX_AVAILABLE = False
 
-# Excel parsing
+# Excel parsing (legacy .xls additionally needs pandas, imported on use)
 try:
-    import pandas as pd
+    import openpyxl
     EXCEL_AVAILABLE = True
 except ImportError:
     EXCEL_AVAILABLE = False
 
+# Faster matcher for the literal-anchored keyword/number scans
+try:
+    import regex as _scan_re
+    REGEX_AVAILABLE = True
+except ImportError:
+    _scan_re = re
+    REGEX_AVAILABLE = False
+
+
+# Pre-compiled extraction patterns
+_SECTION_RES = (
+    # Standard format: V4.1 OBJECTIVE
+    re.compile(r'(V\d+\.\d+(?:\.\d+)?)\s+([A-Z\s&]+)\n\n(.*?)(?=\n\nV\d+\.\d+|$)', re.DOTALL),
+    # Alternative format: 4.1 Objective (not the tail of a V4.1 code)
+    re.compile(r'(?<![\w.])(\d+\.\d+(?:\.\d+)?)\s+([A-Za-z\s&]+)\n\n(.*?)(?=\n\n\d+\.\d+|$)', re.DOTALL),
+    # Header format: ## Section Name
+    re.compile(r'(##\s+)([A-Za-z\s&]+)\n\n(.*?)(?=\n\n##|$)', re.DOTALL)
+)
+
+# The same formats for documents that keep paragraph boundaries (DOCX): a
+# heading is a whole paragraph, and its section runs until the next paragraph
+# that opens with that format's section code (not a subsection like V4.5(a))
+_SECTION_HEADING_RES = (
+    (re.compile(r'(V\d+\.\d+(?:\.\d+)?)\s+([A-Z\s&]+)'), re.compile(r'V\d+\.\d+(?:\.\d+)?\s')),
+    (re.compile(r'(\d+\.\d+(?:\.\d+)?)\s+([A-Za-z\s&]+)'), re.compile(r'\d+\.\d+(?:\.\d+)?\s')),
+    (re.compile(r'(##\s+)([A-Za-z\s&]+)'), re.compile(r'##'))
+)
+
+_REQUIREMENT_RES = (
+    # (a), (b), (c) format
+    re.compile(r'\(([a-z]+)\)\s+(.*?)(?=\n\([a-z]+\)|$)', re.DOTALL),
+    # (i), (ii), (iii) format
+    re.compile(r'\(([ivx]+)\)\s+(.*?)(?=\n\([ivx]+\)|$)', re.DOTALL),
+    # 1., 2., 3. format
+    re.compile(r'(\d+)\.\s+(.*?)(?=\n\d+\.|$)', re.DOTALL),
+    # • bullet points
+    re.compile(r'[•·]\s+(.*?)(?=\n[•·]|$)', re.DOTALL),
+    # - dash points
+    re.compile(r'-\s+(.*?)(?=\n-|$)', re.DOTALL)
+)
+
+# Section, requirement and clause patterns stay on re, which is faster for them
+# Amounts are de-duplicated, so patterns whose hits another pattern already
+# finds ("NZD $N" within "$N", "minimum age N" within "age N") are not scanned.
+# Amounts start at a digit, so a bare comma is never captured.
+# Each scan is paired with the case-folded literals every one of its matches
+# contains; a scan is skipped when the document has none of them.
+_CURRENCY_RES = (
+    (('$',), _scan_re.compile(r'\$\s*(\d[\d,]*)', _scan_re.IGNORECASE)),
+    (('dollar',), _scan_re.compile(r'(\d[\d,]*)\s*dollars?', _scan_re.IGNORECASE))
+)
+_TIME_HINTS = ('month', 'year', 'day', 'week')
+_TIME_RE = _scan_re.compile(r'(\d+)\s+(months?|years?|days?|weeks?)', _scan_re.IGNORECASE)
+_AGE_RES = (
+    (('under', 'over', 'age'), _scan_re.compile(r'(?:under|over|age|aged)\s+(\d+)', _scan_re.IGNORECASE)),
+    (('old',), _scan_re.compile(r'(\d+)\s+years?\s+old', _scan_re.IGNORECASE))
+)
+
+# Conditions: clauses end at ; a newline or a full stop followed by whitespace
+# (so "V4.15" stays intact); each is classified by the modal keywords it contains
+_CLAUSE_RE = re.compile(r'(?:[^.;\n]|\.(?!\s|$))+')
+_CONDITION_HINTS = ('must', 'shall', 'required', 'may', 'can', 'should', 'if')
+_CONDITION_KEYWORD_RE = _scan_re.compile(r'\b(must|shall|required\s+to|may|can|should|if)\s', _scan_re.IGNORECASE)
+_CONDITION_TYPES = {
+    'must': 'mandatory',
+    'shall': 'mandatory',
+    'required': 'mandatory',
+    'may': 'optional',
+    'can': 'optional',
+    'should': 'recommended',
+    'if': 'conditional'
+}
+_CONDITION_TYPE_ORDER = ('mandatory', 'optional', 'recommended', 'conditional')
+
+_VISA_CODE_RE = _scan_re.compile(r'\b[A-Z]\d+\b')
+_DATE_RES = (
+    _scan_re.compile(r'\d{1,2}/\d{1,2}/\d{4}'),
+    _scan_re.compile(r'\d{1,2}-\d{1,2}-\d{4}'),
+    _scan_re.compile(r'\d{4}-\d{1,2}-\d{1,2}')
+)
+_POLICY_REF_RE = re.compile(r'V\d+\.\d+(?:\.\d+)?(?:\([a-z]+\))?')
+
+
+# File extensions the installed optional dependencies can load
+_SUPPORTED_FORMATS = (
+    ('.txt', '.md')
+    + (('.pdf',) if PDF_AVAILABLE else ())
+    + (('.docx', '.doc') if DOCX_AVAILABLE else ())
+    + (('.xlsx', '.xls') if EXCEL_AVAILABLE else ())
+)
+
+# Distinct document texts whose structured extraction is kept in memory
+_STRUCTURE_CACHE_SIZE = 64
+
+# Methods behind extract_structured_content; instances overriding any of them bypass the cache
+_STRUCTURE_METHODS = frozenset({
+    '_extract_content_structure', 'extract_sections', 'extract_sections_from_paragraphs',
+    'extract_requirements', 'extract_thresholds', 'extract_conditions', 'extract_policy_metadata'
+})
+
+
+def _extract_pdf_pages(pages: Sequence[Any]) -> Tuple[List[str], List[Any]]:
+    """Extract non-empty page text and tables from pdfplumber pages, releasing each page."""
+    parts, tables = [], []
+    
+    # Text and tables in one pass so each page is parsed once
+    for page in pages:
+        page_text = page.extract_text()
+        if page_text:
+            parts.append(page_text)
+        page_tables = page.extract_tables()
+        if page_tables:
+            tables.extend(page_tables)
+        # Release the page's parsed objects (close() is newer than flush_cache())
+        (getattr(page, 'close', None) or page.flush_cache)()
+    
+    return parts, tables
+
+
+def _mentions(folded: str, hints: Sequence[str]) -> bool:
+    """Whether case-folded text contains any of the given literals."""
+    return any(hint in folded for hint in hints)
+
+
+def _extract_pdfium_text(path: Path) -> Tuple[List[str], int]:
+    """Extract non-empty page text and the page count with PDFium."""
+    parts = []
+    pdf = pdfium.PdfDocument(path)
+    try:
+        for page in pdf:
+            text_page = page.get_textpage()
+            page_text = text_page.get_text_range().replace('\r\n', '\n')
+            if page_text:
+                parts.append(page_text)
+            text_page.close()
+            page.close()
+        return parts, len(pdf)
+    finally:
+        pdf.close()
+
+
+def _read_xlsx_rows(path: Path) -> Dict[str, List[tuple]]:
+    """Stream each worksheet's non-empty rows with openpyxl in read-only mode."""
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        return {
+            worksheet.title: [
+                row for row in worksheet.iter_rows(values_only=True)
+                if any(value is not None for value in row)
+            ]
+            for worksheet in workbook.worksheets
+        }
+    finally:
+        workbook.close()
+
+
+def _read_xls_rows(path: Path) -> Dict[str, List[tuple]]:
+    """Read legacy .xls sheets through pandas (header row first, blanks as None)."""
+    import pandas as pd
+    
+    sheets = pd.read_excel(path, sheet_name=None)
+    return {
+        sheet_name: [tuple(df.columns)] + list(
+            df.astype(object).where(df.notna(), None).itertuples(index=False, name=None)
+        )
+        for sheet_name, df in sheets.items()
+    }
+
 
 class EnhancedDocumentParser:
     """Enhanced document parser supporting multiple file formats."""
     
     def __init__(self):
         self.logger = logging.getLogger(__name__)
-        self.supported_formats = ['.txt', '.md']
-        
-        if PDF_AVAILABLE:
-            self.supported_formats.extend(['.pdf'])
-        if DOCX_AVAILABLE:
-            self.supported_formats.extend(['.docx', '.doc'])
-        if EXCEL_AVAILABLE:
-            self.supported_formats.extend(['.xlsx', '.xls'])
+        self.supported_formats = list(_SUPPORTED_FORMATS)
     
     def get_supported_formats(self) -> List[str]:
         """Get list of supported file formats."""
@@ -89,7 +259,6 @@ class EnhancedDocumentParser:
     
     def _load_pdf_document(self, path: Path) -> Dict[str, Any]:
         """Load PDF document with enhanced text extraction."""
-        content = ""
         metadata = {
             'filename': path.name,
             'format': '.pdf',
@@ -97,39 +266,40 @@ class EnhancedDocumentParser:
             'extraction_method': 'pdfplumber'
         }
         
-        try:
-            # Try pdfplumber first (better for structured documents)
-            with pdfplumber.open(path) as pdf:
-                metadata['pages'] = len(pdf.pages)
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        content += page_text + "\n\n"
-                        
-                # Extract tables if present
-                tables = []
-                for page in pdf.pages:
-                    page_tables = page.extract_tables()
-                    if page_tables:
-                        tables.extend(page_tables)
+        parts = None
+        if PDFIUM_AVAILABLE:
+            try:
+                parts, metadata['pages'] = _extract_pdfium_text(path)
+                metadata['extraction_method'] = 'pypdfium2'
+            except Exception as e:
+                self.logger.warning(f"pypdfium2 failed, trying pdfplumber: {e}")
+        
+        if parts is None:
+            try:
+                # pdfplumber also counts tables, but parses pages far more slowly
+                with pdfplumber.open(path) as pdf:
+                    metadata['pages'] = len(pdf.pages)
+                    parts, tables = _extract_pdf_pages(pdf.pages)
                 
                 metadata['tables_found'] = len(tables)
-                
-        except Exception as e:
-            self.logger.warning(f"pdfplumber failed, trying PyPDF2: {e}")
-            # Fallback to PyPDF2
-            try:
-                with open(path, 'rb') as file:
-                    pdf_reader = PyPDF2.PdfReader(file)
-                    metadata['pages'] = len(pdf_reader.pages)
-                    metadata['extraction_method'] = 'PyPDF2'
                     
-                    for page in pdf_reader.pages:
-                        content += page.extract_text() + "\n\n"
+            except Exception as e:
+                self.logger.warning(f"pdfplumber failed, trying PyPDF2: {e}")
+                # Fallback to PyPDF2
+                parts = []
+                try:
+                    with open(path, 'rb') as file:
+                        pdf_reader = PyPDF2.PdfReader(file)
+                        metadata['pages'] = len(pdf_reader.pages)
+                        metadata['extraction_method'] = 'PyPDF2'
                         
-            except Exception as e2:
-                raise ValueError(f"Failed to parse PDF: {e2}")
-        
+                        for page in pdf_reader.pages:
+                            parts.append(page.extract_text())
+                            
+                except Exception as e2:
+                    raise ValueError(f"Failed to parse PDF: {e2}")
+            
+        content = "".join(f"{part}\n\n" for part in parts)
         metadata['size'] = len(content)
         
         return {
@@ -142,11 +312,10 @@ class EnhancedDocumentParser:
         """Load Word document."""
         try:
             doc = DocxDocument(path)
-            content = ""
             
             # Extract paragraphs
-            for paragraph in doc.paragraphs:
-                content += paragraph.text + "\n"
+            paragraphs = [paragraph.text for paragraph in doc.paragraphs]
+            content = "".join(f"{text}\n" for text in paragraphs)
             
             # Extract tables
             tables_content = []
@@ -161,7 +330,7 @@ class EnhancedDocumentParser:
                 'filename': path.name,
                 'format': '.docx',
                 'size': len(content),
-                'paragraphs': len(doc.paragraphs),
+                'paragraphs': len(paragraphs),
                 'tables': len(doc.tables)
             }
             
@@ -169,6 +338,7 @@ class EnhancedDocumentParser:
                 'content': content,
                 'format': 'docx',
                 'metadata': metadata,
+                'paragraphs': paragraphs,
                 'tables': tables_content
             }
             
@@ -176,27 +346,37 @@ class EnhancedDocumentParser:
             raise ValueError(f"Failed to parse Word document: {e}")
     
     def _load_excel_document(self, path: Path) -> Dict[str, Any]:
-        """Load Excel document."""
+        """
+        Load Excel document.
+        
+        Each sheet's text is a "=== Sheet: <name> ===" line followed by one
+        tab-separated line per non-empty row, header row first, and 'sheets'
+        maps sheet names to those rows as tuples (not DataFrames).
+        """
         try:
-            # Read all sheets
-            excel_file = pd.ExcelFile(path)
-            sheets_content = {}
-            content = ""
+            # Read all sheets as lists of row tuples
+            if path.suffix.lower() == '.xls':
+                sheets_content = _read_xls_rows(path)
+            else:
+                sheets_content = _read_xlsx_rows(path)
             
-            for sheet_name in excel_file.sheet_names:
-                df = pd.read_excel(path, sheet_name=sheet_name)
-                sheets_content[sheet_name] = df
-                
-                # Convert to text representation
-                content += f"\n\n=== Sheet: {sheet_name} ===\n"
-                content += df.to_string(index=False) + "\n"
+            # Convert to text representation, one tab-separated line per row
+            parts = []
+            for sheet_name, rows in sheets_content.items():
+                parts.append(f"\n\n=== Sheet: {sheet_name} ===\n")
+                parts.extend(
+                    "\t".join("" if value is None else str(value) for value in row) + "\n"
+                    for row in rows
+                )
+            
+            content = "".join(parts)
             
             metadata = {
                 'filename': path.name,
                 'format': path.suffix,
                 'size': len(content),
-                'sheets': list(excel_file.sheet_names),
-                'total_sheets': len(excel_file.sheet_names)
+                'sheets': list(sheets_content),
+                'total_sheets': len(sheets_content)
             }
             
             return {
@@ -219,11 +399,27 @@ class EnhancedDocumentParser:
         Returns:
             Structured content with sections, requirements, etc.
         """
-        content = document_data['content']
-        doc_format = document_data['format']
-        
-        # Extract sections
-        sections = self.extract_sections(content)
+        # Content-derived results are memoized per parser class and distinct text;
+        # each call unpickles its own copy so callers can modify the result freely
+        paragraphs = document_data.get('paragraphs')
+        if paragraphs is not None:
+            paragraphs = tuple(paragraphs)
+        if _STRUCTURE_METHODS.isdisjoint(vars(self)):
+            structured = pickle.loads(_pickled_structure(type(self), document_data['content'], paragraphs))
+        else:
+            structured = self._extract_content_structure(document_data['content'], paragraphs)
+        structured['document_format'] = document_data['format']
+        structured['original_metadata'] = document_data['metadata']
+        return structured
+    
+    def _extract_content_structure(self, content: str,
+                                   paragraphs: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+        """Run every extractor over the document text."""
+        # Extract sections, from paragraph boundaries when the format has them
+        if paragraphs is None:
+            sections = self.extract_sections(content)
+        else:
+            sections = self.extract_sections_from_paragraphs(paragraphs)
         
         # Extract requirements from each section
         all_requirements = []
@@ -247,28 +443,16 @@ class EnhancedDocumentParser:
             'requirements': all_requirements,
             'thresholds': thresholds,
             'conditions': conditions,
-            'policy_metadata': policy_metadata,
-            'document_format': doc_format,
-            'original_metadata': document_data['metadata']
+            'policy_metadata': policy_metadata
         }
     
     def extract_sections(self, document: str) -> Dict[str, Dict[str, str]]:
         """Extract sections from policy document."""
         sections = {}
         
-        # Enhanced pattern for various section formats
-        patterns = [
-            # Standard format: V4.1 OBJECTIVE
-            r'(V\d+\.\d+(?:\.\d+)?)\s+([A-Z\s&]+)\n\n(.*?)(?=\n\nV\d+\.\d+|$)',
-            # Alternative format: 4.1 Objective
-            r'(\d+\.\d+(?:\.\d+)?)\s+([A-Za-z\s&]+)\n\n(.*?)(?=\n\n\d+\.\d+|$)',
-            # Header format: ## Section Name
-            r'(##\s+)([A-Za-z\s&]+)\n\n(.*?)(?=\n\n##|$)'
-        ]
-        
-        for pattern in patterns:
-            matches = re.finditer(pattern, document, re.DOTALL)
-            for match in matches:
+        # Try each supported section format in turn
+        for pattern in _SECTION_RES:
+            for match in pattern.finditer(document):
                 section_code = match.group(1).strip()
                 section_title = match.group(2).strip()
                 section_content = match.group(3).strip()
@@ -280,28 +464,36 @@ class EnhancedDocumentParser:
         
         return sections
     
+    def extract_sections_from_paragraphs(self, paragraphs: Sequence[str]) -> Dict[str, Dict[str, str]]:
+        """Extract sections from a document's paragraphs, matching headings per paragraph."""
+        sections = {}
+        
+        for heading_re, boundary_re in _SECTION_HEADING_RES:
+            heading, body = None, []
+            # A boundary paragraph, or the trailing None, closes the open section
+            for paragraph in (*paragraphs, None):
+                if paragraph is not None and not boundary_re.match(paragraph):
+                    body.append(paragraph)
+                    continue
+                if heading:
+                    sections[heading.group(1).strip()] = {
+                        'title': heading.group(2).strip(),
+                        'content': "\n".join(body).strip()
+                    }
+                heading = heading_re.fullmatch(paragraph) if paragraph is not None else None
+                body = []
+        
+        return sections
+    
     def extract_requirements(self, section_content: str) -> List[str]:
         """Extract requirements from section content."""
         requirements = []
         
         # Multiple patterns for different requirement formats
-        patterns = [
-            # (a), (b), (c) format
-            r'\(([a-z]+)\)\s+(.*?)(?=\n\([a-z]+\)|$)',
-            # (i), (ii), (iii) format
-            r'\(([ivx]+)\)\s+(.*?)(?=\n\([ivx]+\)|$)',
-            # 1., 2., 3. format
-            r'(\d+)\.\s+(.*?)(?=\n\d+\.|$)',
-            # • bullet points
-            r'[•·]\s+(.*?)(?=\n[•·]|$)',
-            # - dash points
-            r'-\s+(.*?)(?=\n-|$)'
-        ]
-        
-        for pattern in patterns:
-            matches = re.finditer(pattern, section_content, re.DOTALL)
-            for match in matches:
-                requirement = match.group(2).strip() if len(match.groups()) > 1 else match.group(1).strip()
+        for pattern in _REQUIREMENT_RES:
+            body_group = 2 if pattern.groups > 1 else 1
+            for match in pattern.finditer(section_content):
+                requirement = match.group(body_group).strip()
                 if requirement and len(requirement) > 10:  # Filter out very short matches
                     requirements.append(requirement)
         
@@ -310,95 +502,83 @@ class EnhancedDocumentParser:
     def extract_thresholds(self, document: str) -> Dict[str, Any]:
         """Extract numerical thresholds from document."""
         thresholds = {}
+        folded = document.casefold()
         
         # Enhanced currency extraction
-        currency_patterns = [
-            r'NZD\s*\$\s*([\d,]+)',
-            r'\$\s*([\d,]+)',
-            r'([\d,]+)\s*dollars?'
-        ]
-        
-        amounts = []
-        for pattern in currency_patterns:
-            matches = re.findall(pattern, document, re.IGNORECASE)
-            amounts.extend([int(a.replace(',', '')) for a in matches])
+        amounts = set()
+        for hints, pattern in _CURRENCY_RES:
+            if _mentions(folded, hints):
+                amounts.update(int(a.replace(',', '')) for a in pattern.findall(document))
         
         # Time periods
-        time_pattern = r'(\d+)\s+(months?|years?|days?|weeks?)'
-        periods = re.findall(time_pattern, document, re.IGNORECASE)
+        periods = _TIME_RE.findall(document) if _mentions(folded, _TIME_HINTS) else []
         
         # Age limits
-        age_patterns = [
-            r'(?:under|over|age|aged)\s+(\d+)',
-            r'(\d+)\s+years?\s+old',
-            r'minimum\s+age\s+(\d+)'
-        ]
-        
-        ages = []
-        for pattern in age_patterns:
-            matches = re.findall(pattern, document, re.IGNORECASE)
-            ages.extend([int(a) for a in matches])
+        ages = set()
+        for hints, pattern in _AGE_RES:
+            if _mentions(folded, hints):
+                ages.update(map(int, pattern.findall(document)))
         
-        thresholds['currency_amounts'] = sorted(set(amounts))
+        thresholds['currency_amounts'] = sorted(amounts)
         thresholds['time_periods'] = periods
-        thresholds['age_limits'] = sorted(set(ages))
+        thresholds['age_limits'] = sorted(ages)
         
         return thresholds
     
     def extract_conditions(self, document: str) -> List[Dict[str, str]]:
         """Extract conditional statements."""
-        conditions = []
+        if not _mentions(document.casefold(), _CONDITION_HINTS):
+            return []
         
-        # Enhanced condition patterns
-        condition_patterns = [
-            (r'(.*?must\s+.*?)(?:\.|;|\n)', 'mandatory'),
-            (r'(.*?shall\s+.*?)(?:\.|;|\n)', 'mandatory'),
-            (r'(.*?required\s+to\s+.*?)(?:\.|;|\n)', 'mandatory'),
-            (r'(.*?may\s+.*?)(?:\.|;|\n)', 'optional'),
-            (r'(.*?can\s+.*?)(?:\.|;|\n)', 'optional'),
-            (r'(.*?should\s+.*?)(?:\.|;|\n)', 'recommended'),
-            (r'(.*?if\s+.*?)(?:\.|;|\n)', 'conditional')
-        ]
+        by_type = {condition_type: [] for condition_type in _CONDITION_TYPE_ORDER}
         
-        for pattern, condition_type in condition_patterns:
-            matches = re.finditer(pattern, document, re.IGNORECASE)
-            for match in matches:
-                statement = match.group(1).strip()
-                if len(statement) > 15:  # Filter short matches
-                    conditions.append({
-                        'type': condition_type,
-                        'statement': statement
-                    })
+        for clause in _CLAUSE_RE.finditer(document):
+            statement = clause.group().strip()
+            if len(statement) <= 15:  # Filter short matches
+                continue
+            
+            # One entry per condition type found in the clause
+            found = {
+                _CONDITION_TYPES[keyword.group(1).split(None, 1)[0].lower()]
+                for keyword in _CONDITION_KEYWORD_RE.finditer(statement)
+            }
+            for condition_type in found:
+                by_type[condition_type].append({
+                    'type': condition_type,
+                    'statement': statement
+                })
         
-        return conditions
+        return [condition for condition_type in _CONDITION_TYPE_ORDER for condition in by_type[condition_type]]
     
     def extract_policy_metadata(self, document: str) -> Dict[str, Any]:
         """Extract policy-specific metadata."""
         metadata = {}
         
         # Extract visa codes
-        visa_codes = re.findall(r'\b[A-Z]\d+\b', document)
+        visa_codes = _VISA_CODE_RE.findall(document)
         metadata['visa_codes'] = list(set(visa_codes))
         
         # Extract dates
-        date_patterns = [
-            r'\d{1,2}/\d{1,2}/\d{4}',
-            r'\d{1,2}-\d{1,2}-\d{4}',
-            r'\d{4}-\d{1,2}-\d{1,2}'
-        ]
-        
         dates = []
-        for pattern in date_patterns:
-            dates.extend(re.findall(pattern, document))
+        for pattern in _DATE_RES:
+            dates.extend(pattern.findall(document))
         metadata['dates_mentioned'] = dates
         
         # Extract policy references
-        policy_refs = re.findall(r'V\d+\.\d+(?:\.\d+)?(?:\([a-z]+\))?', document)
+        policy_refs = _POLICY_REF_RE.findall(document)
         metadata['policy_references'] = list(set(policy_refs))
         
         return metadata
 
 
+@lru_cache(maxsize=_STRUCTURE_CACHE_SIZE)
+def _pickled_structure(parser_cls: type, content: str,
+                       paragraphs: Optional[Tuple[str, ...]] = None) -> bytes:
+    """Pickled extraction results for a document text, cached by parser class and content."""
+    structure = parser_cls()._extract_content_structure(content, paragraphs)
+    return pickle.dumps(structure, pickle.HIGHEST_PROTOCOL)
+
+
 # Utility function for easy import
 def create_document_parser() -> EnhancedDocumentParser:
     """Create and return an enhanced document parser instance."""
@@ -406,6 +586,7 @@ def create_document_parser() -> EnhancedDocumentParser:
 
 
 # Check what formats are available
+@cache
 def get_available_formats() -> Dict[str, bool]:
     """Get information about available document formats."""
     return {
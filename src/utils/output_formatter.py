@@ -3,6 +3,13 @@ from typing import Dict, Any, List
 from pathlib import Path
 from datetime import datetime
 
+# Fast JSON encoding/decoding for saved outputs
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class OutputFormatter:
     """Utility class for formatting and saving agent outputs."""
@@ -20,6 +27,14 @@ class OutputFormatter:
         path = Path(output_path)
         path.parent.mkdir(parents=True, exist_ok=True)
         
+        if ORJSON_AVAILABLE:
+            option = orjson.OPT_NON_STR_KEYS
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+            with open(path, 'wb') as f:
+                f.write(orjson.dumps(data, option=option))
+            return
+        
         with open(path, 'w', encoding='utf-8') as f:
             if pretty:
                 json.dump(data, f, indent=2, ensure_ascii=False)
@@ -37,6 +52,10 @@ class OutputFormatter:
         Returns:
             Loaded data
         """
+        if ORJSON_AVAILABLE:
+            with open(input_path, 'rb') as f:
+                return orjson.loads(f.read())
+        
         with open(input_path, 'r', encoding='utf-8') as f:
             return json.load(f)
     
@@ -70,11 +89,12 @@ class OutputFormatter:
             output.append("-" * 80)
             
             for req in reqs:
-                output.append(f"\nID: {req.get('requirement_id', 'N/A')}")
-                output.append(f"Description: {req.get('description', 'N/A')}")
-                output.append(f"Priority: {req.get('priority', 'N/A')}")
-                output.append(f"Policy Ref: {req.get('policy_reference', 'N/A')}")
-                output.append("")
+                output.append(
+                    f"\nID: {req.get('requirement_id', 'N/A')}\n"
+                    f"Description: {req.get('description', 'N/A')}\n"
+                    f"Priority: {req.get('priority', 'N/A')}\n"
+                    f"Policy Ref: {req.get('policy_reference', 'N/A')}\n"
+                )
         
         return "\n".join(output)
     
@@ -108,9 +128,11 @@ class OutputFormatter:
             output.append("-" * 80)
             
             for q in qs:
-                output.append(f"\nQ{q.get('question_id', 'N/A')}: {q.get('question_text', 'N/A')}")
-                output.append(f"Type: {q.get('input_type', 'N/A')}")
-                output.append(f"Required: {q.get('required', False)}")
+                output.append(
+                    f"\nQ{q.get('question_id', 'N/A')}: {q.get('question_text', 'N/A')}\n"
+                    f"Type: {q.get('input_type', 'N/A')}\n"
+                    f"Required: {q.get('required', False)}"
+                )
                 
                 if q.get('help_text'):
                     output.append(f"Help: {q['help_text']}")
@@ -15,7 +15,7 @@ from src.agents import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def sample_config():
     """Sample configuration for testing."""
     return {
@@ -31,7 +31,7 @@ def sample_policy_path():
     return str(project_root / 'data' / 'input' / 'parent_boost_policy.txt')
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def sample_policy_structure():
     """Sample policy structure for testing."""
     return {
@@ -50,7 +50,7 @@ def sample_policy_structure():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def sample_requirements():
     """Sample requirements for testing."""
     return {
@@ -84,6 +84,18 @@ def sample_requirements():
     }
 
 
+@pytest.fixture(scope='module')
+def validation_agent(sample_config):
+    """ValidationAgent shared by tests that only call its validation helpers."""
+    return ValidationAgent('ValidationAgent', sample_config)
+
+
+@pytest.fixture(scope='module')
+def consolidation_agent(sample_config):
+    """ConsolidationAgent shared by tests that only call its helpers."""
+    return ConsolidationAgent('ConsolidationAgent', sample_config)
+
+
 class TestPolicyEvaluatorAgent:
     """Tests for PolicyEvaluatorAgent."""
     
@@ -184,11 +196,9 @@ class TestValidationAgent:
         assert agent.name == 'ValidationAgent'
         assert agent.llm is not None
     
-    def test_requirement_validation(self, sample_config, sample_requirements):
+    def test_requirement_validation(self, validation_agent, sample_requirements):
         """Test requirement validation logic."""
-        agent = ValidationAgent('ValidationAgent', sample_config)
-        
-        req_validation = agent._validate_requirements(
+        req_validation = validation_agent._validate_requirements(
             sample_requirements['functional_requirements']
         )
         
@@ -196,10 +206,8 @@ class TestValidationAgent:
         assert 'valid_requirements' in req_validation
         assert 'validation_rate' in req_validation
     
-    def test_question_validation(self, sample_config):
+    def test_question_validation(self, validation_agent):
         """Test question validation logic."""
-        agent = ValidationAgent('ValidationAgent', sample_config)
-        
         sample_questions = [
             {
                 'question_id': 'Q-001',
@@ -209,7 +217,7 @@ class TestValidationAgent:
             }
         ]
         
-        q_validation = agent._validate_questions(sample_questions)
+        q_validation = validation_agent._validate_questions(sample_questions)
         
         assert 'total_questions' in q_validation
         assert 'valid_questions' in q_validation
@@ -225,10 +233,8 @@ class TestConsolidationAgent:
         assert agent.name == 'ConsolidationAgent'
         assert agent.llm is not None
     
-    def test_traceability_matrix_creation(self, sample_config, sample_requirements):
+    def test_traceability_matrix_creation(self, consolidation_agent, sample_requirements):
         """Test traceability matrix creation."""
-        agent = ConsolidationAgent('ConsolidationAgent', sample_config)
-        
         questions = [
             {
                 'question_id': 'Q-001',
@@ -236,17 +242,15 @@ class TestConsolidationAgent:
             }
         ]
         
-        matrix = agent._create_traceability_matrix(sample_requirements, questions)
+        matrix = consolidation_agent._create_traceability_matrix(sample_requirements, questions)
         
         assert isinstance(matrix, list)
         if matrix:
             assert 'policy_reference' in matrix[0]
             assert 'requirement_id' in matrix[0]
     
-    def test_summary_stats_generation(self, sample_config, sample_requirements):
+    def test_summary_stats_generation(self, consolidation_agent, sample_requirements):
         """Test summary statistics generation."""
-        agent = ConsolidationAgent('ConsolidationAgent', sample_config)
-        
         questions = [
             {
                 'question_id': 'Q-001',
@@ -260,7 +264,7 @@ class TestConsolidationAgent:
             'question_validation': {'validation_rate': 80.0}
         }
         
-        stats = agent._generate_summary_stats(
+        stats = consolidation_agent._generate_summary_stats(
             sample_requirements,
             questions,
             validation_report
@@ -0,0 +1,63 @@
+import pytest
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils.document_parser import DocumentParser
+
+
+class TestExtractConditions:
+    """Tests for DocumentParser.extract_conditions clause splitting."""
+    
+    def test_splits_on_semicolons_full_stops_and_newlines(self):
+        """Test each clause is returned whole, split at ; . and newlines."""
+        document = (
+            "Applicants must hold a passport; sponsors may apply online.\n"
+            "Funds must be shown. Partners may attend"
+        )
+        
+        conditions = DocumentParser.extract_conditions(document)
+        
+        assert conditions == [
+            {'type': 'requirement', 'statement': 'Applicants must hold a passport'},
+            {'type': 'requirement', 'statement': 'Funds must be shown'},
+            {'type': 'optional', 'statement': 'sponsors may apply online'},
+            {'type': 'optional', 'statement': 'Partners may attend'}
+        ]
+    
+    def test_decimal_does_not_end_clause(self):
+        """Test a full stop inside a number such as 4.1 stays in the clause."""
+        conditions = DocumentParser.extract_conditions("Applicants must meet section 4.1 criteria.")
+        
+        assert conditions == [
+            {'type': 'requirement', 'statement': 'Applicants must meet section 4.1 criteria'}
+        ]
+    
+    def test_abbreviation_full_stop_ends_clause(self):
+        """Test a full stop followed by a space ends the clause, even after an abbreviation."""
+        conditions = DocumentParser.extract_conditions("Funds must be shown, e.g. bank statements.")
+        
+        assert conditions == [{'type': 'requirement', 'statement': 'Funds must be shown, e.g'}]
+    
+    def test_must_and_may_need_whole_words(self):
+        """Test must/may only match as whole words followed by whitespace."""
+        document = "Dismay is common. They mustn't lie. Mayors may vote. Everyone MUST register."
+        
+        conditions = DocumentParser.extract_conditions(document)
+        
+        assert conditions == [
+            {'type': 'requirement', 'statement': 'Everyone MUST register'},
+            {'type': 'optional', 'statement': 'Mayors may vote'}
+        ]
+    
+    def test_clause_with_must_and_may_is_both(self):
+        """Test a clause containing both keywords is reported once per type."""
+        conditions = DocumentParser.extract_conditions("Applicants must apply and may withdraw.")
+        
+        assert [condition['type'] for condition in conditions] == ['requirement', 'optional']
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
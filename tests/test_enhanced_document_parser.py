@@ -0,0 +1,114 @@
+import pytest
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils.enhanced_document_parser import EnhancedDocumentParser
+
+
+@pytest.fixture(scope='module')
+def parser():
+    """Shared parser instance."""
+    return EnhancedDocumentParser()
+
+
+class TestExtractSectionsFromParagraphs:
+    """Tests for paragraph-based (DOCX) section detection."""
+    
+    def test_sections_split_at_heading_paragraphs(self, parser):
+        """Test each heading paragraph opens a section holding the paragraphs after it."""
+        paragraphs = [
+            'Preamble text',
+            'V4.1 OBJECTIVE',
+            '',
+            'The objective is family reunification.',
+            'Second line.',
+            'V4.2 ELIGIBILITY & HEALTH',
+            'Applicants must be healthy.'
+        ]
+        
+        sections = parser.extract_sections_from_paragraphs(paragraphs)
+        
+        assert sections == {
+            'V4.1': {
+                'title': 'OBJECTIVE',
+                'content': 'The objective is family reunification.\nSecond line.'
+            },
+            'V4.2': {'title': 'ELIGIBILITY & HEALTH', 'content': 'Applicants must be healthy.'}
+        }
+    
+    def test_v_code_heading_is_not_a_numeric_section(self, parser):
+        """Test a V4.1 heading paragraph does not also yield a 4.1 section."""
+        sections = parser.extract_sections_from_paragraphs(['V4.1 OBJECTIVE', 'Body text.'])
+        
+        assert list(sections) == ['V4.1']
+    
+    def test_markdown_headings(self, parser):
+        """Test ## headings are detected as their own format."""
+        sections = parser.extract_sections_from_paragraphs(['## Fees', 'Pay the fee.', '## Health', 'Be healthy.'])
+        
+        # Sections are keyed by their code, so repeated ## headings keep the last one
+        assert sections == {'##': {'title': 'Health', 'content': 'Be healthy.'}}
+
+
+
+class TestExtractSections:
+    """Tests for text-based section detection."""
+    
+    def test_v_code_heading_is_not_a_numeric_section(self, parser):
+        """Test "V4.1" text does not also yield a 4.1 section."""
+        document = "V4.1 OBJECTIVE\n\nFamily reunification.\n\nV4.2 FEES\n\nPay the fee."
+        
+        sections = parser.extract_sections(document)
+        
+        assert sorted(sections) == ['V4.1', 'V4.2']
+        assert sections['V4.1'] == {'title': 'OBJECTIVE', 'content': 'Family reunification.'}
+    
+    def test_numeric_headings(self, parser):
+        """Test bare numeric headings are still detected."""
+        sections = parser.extract_sections("4.1 Objective\n\nFamily reunification.")
+        
+        assert sections == {'4.1': {'title': 'Objective', 'content': 'Family reunification.'}}
+
+
+
+class TestLoadExcelDocument:
+    """Tests for the Excel loader."""
+    
+    def test_xlsx_round_trip(self, parser, tmp_path):
+        """Test an xlsx workbook loads as tab-separated rows per sheet."""
+        openpyxl = pytest.importorskip('openpyxl')
+        workbook = openpyxl.Workbook()
+        fees = workbook.active
+        fees.title = 'Fees'
+        fees.append(['Item', 'Amount'])
+        fees.append(['Application', 450])
+        fees.append([None, None])
+        fees.append(['Levy', None])
+        workbook.create_sheet('Notes').append(['Pay in NZD'])
+        path = tmp_path / 'policy.xlsx'
+        workbook.save(path)
+        
+        document = parser.load_document(str(path))
+        
+        assert document['format'] == 'excel'
+        assert document['content'] == (
+            "\n\n=== Sheet: Fees ===\n"
+            "Item\tAmount\n"
+            "Application\t450\n"
+            "Levy\t\n"
+            "\n\n=== Sheet: Notes ===\n"
+            "Pay in NZD\n"
+        )
+        assert document['sheets'] == {
+            'Fees': [('Item', 'Amount'), ('Application', 450), ('Levy', None)],
+            'Notes': [('Pay in NZD',)]
+        }
+        assert document['metadata']['sheets'] == ['Fees', 'Notes']
+        assert document['metadata']['total_sheets'] == 2
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])